@@ -1,31 +1,39 @@
+import time
 import streamlit as st
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
+from student_data import REPORT_COLUMNS, SCORE_COLUMNS, file_hash
+from student_loaders import load_cohort, load_model, load_moments, load_scores, predictions_csv
+from common.lazy import lazy_import, preload
+from common import profiling
+from common.table_view import paged_table
+
+sns = lazy_import("seaborn")
+plt = lazy_import("matplotlib.pyplot")
 
 # Title
 st.set_page_config(page_title="Student Performance Analysis", layout="wide")
 st.title("📊 Student Performance Analysis Dashboard")
+profiling.begin("student")
+preload(sns, plt)
+
+def group_average(moments, selection, column):
+    groups = moments.combine(selection, by=column)
+    return pd.Series({key: m.mean[-1] for key, m in groups.items()}, name="Average Score").sort_values()
 
 # Upload File
 uploaded_file = st.file_uploader("Upload Excel file", type=["xlsx"])
 
 if uploaded_file is not None:
     # Load data
-    df = pd.read_excel(uploaded_file)
-
-    # Clean column names
-    df.columns = df.columns.str.strip()
+    raw_bytes = uploaded_file.getvalue()
+    content_hash = file_hash(raw_bytes)
+    df = load_scores(content_hash, raw_bytes)
+    moments = load_moments(content_hash, df)
 
     # Show raw data
     with st.expander("🔍 View Raw Data"):
-        st.dataframe(df)
-
-    # Drop missing values in score columns
-    df.dropna(subset=["Math Score", "Reading Score", "Writing Score"], inplace=True)
-
-    # Add a new column: Average Score
-    df["Average Score"] = df[["Math Score", "Reading Score", "Writing Score"]].mean(axis=1)
+        # The sheet as uploaded, before rows with missing scores are dropped
+        paged_table(load_cohort(content_hash, raw_bytes), "student_raw", token=content_hash)
 
     # Sidebar filters
     st.sidebar.header("🔧 Filter Students")
@@ -34,19 +42,28 @@ if uploaded_file is not None:
     prep_filter = st.sidebar.multiselect("Test Preparation", options=df["Test Preparation"].unique(), default=df["Test Preparation"].unique())
 
     # Apply filters
-    filtered_df = df[
-        (df["Gender"].isin(gender_filter)) &
-        (df["Ethnicity"].isin(ethnicity_filter)) &
-        (df["Test Preparation"].isin(prep_filter))
-    ]
+    with profiling.stage("filter", rows=len(df)):
+        filter_mask = (
+            (df["Gender"].isin(gender_filter)) &
+            (df["Ethnicity"].isin(ethnicity_filter)) &
+            (df["Test Preparation"].isin(prep_filter))
+        )
+        filtered_df = df[filter_mask]
+        selection = {"Gender": gender_filter, "Ethnicity": ethnicity_filter, "Test Preparation": prep_filter}
+        filtered_moments = moments.combine(selection)
 
     # Show filtered data
     st.subheader("📄 Filtered Student Data")
-    st.dataframe(filtered_df)
+    paged_table(df, "student_filtered", mask=filter_mask, token=content_hash)
 
     # Statistics
     st.subheader("📈 Summary Statistics")
-    st.write(filtered_df.describe())
+    with profiling.stage("summary statistics"):
+        # Quartiles come from score histograms; scores off their grid need the rows themselves
+        if filtered_moments.off_grid:
+            st.write(filtered_df[REPORT_COLUMNS].describe())
+        else:
+            st.write(filtered_moments.describe())
 
     # Visualization Section
     st.subheader("📊 Visualizations")
@@ -55,19 +72,71 @@ if uploaded_file is not None:
 
     with col1:
         st.markdown("### Average Score by Gender")
-        gender_avg = filtered_df.groupby("Gender")["Average Score"].mean().sort_values()
+        gender_avg = group_average(moments, selection, "Gender")
         st.bar_chart(gender_avg)
 
     with col2:
         st.markdown("### Average Score by Test Preparation")
-        prep_avg = filtered_df.groupby("Test Preparation")["Average Score"].mean().sort_values()
+        prep_avg = group_average(moments, selection, "Test Preparation")
         st.bar_chart(prep_avg)
 
     st.markdown("### Correlation Heatmap")
-    fig, ax = plt.subplots()
-    sns.heatmap(filtered_df[["Math Score", "Reading Score", "Writing Score", "Average Score"]].corr(), annot=True, cmap="coolwarm", ax=ax)
-    st.pyplot(fig)
+    with profiling.stage("chart: correlation heatmap"):
+        fig, ax = plt.subplots()
+        sns.heatmap(filtered_moments.corr(), annot=True, cmap="coolwarm", ax=ax)
+        st.pyplot(fig)
+
+    # Prediction Section
+    st.subheader("🔮 Score Prediction")
+    model = load_model(content_hash, df)
+    st.caption(
+        f"Ridge regression on {', '.join(model.features)}, trained in {model.fit_seconds * 1000:.0f} ms. "
+        + ", ".join(f"{col} R² {model.r2[col]:.2f}" for col in SCORE_COLUMNS)
+    )
+
+    cohort_tab, what_if_tab = st.tabs(["Cohort Predictions", "What-if"])
+
+    with cohort_tab:
+        cohort_file = st.file_uploader("Score another cohort (optional)", type=["xlsx"], key="cohort_file")
+        # The cohort's key names the model's dataset and the cohort: an upload or the current filters
+        if cohort_file is not None:
+            cohort_bytes = cohort_file.getvalue()
+            cohort_key = (content_hash, "upload", file_hash(cohort_bytes))
+            cohort = load_cohort(cohort_key[-1], cohort_bytes)
+        else:
+            cohort_key = (content_hash, "filtered", tuple((col, tuple(sorted(map(str, values))))
+                                                           for col, values in selection.items()))
+            cohort = filtered_df
+        start = time.perf_counter()
+        with profiling.stage("predict cohort", rows=len(cohort)):
+            predictions = model.predict(cohort)
+        elapsed = time.perf_counter() - start
+        st.caption(f"Scored {len(cohort):,} students in {elapsed * 1000:.1f} ms")
+        scored = pd.concat([cohort, predictions], axis=1)
+        paged_table(scored, "student_cohort", token=cohort_key)
+        st.download_button(
+            label="Download predictions as CSV",
+            data=lambda: predictions_csv(cohort_key, scored),
+            file_name="student_predictions.csv",
+            mime="text/csv"
+        )
+
+    with what_if_tab:
+        what_if_cols = st.columns(len(model.features))
+        student = {
+            col: what_if_col.selectbox(col, model.levels[col], key=f"what_if_{col}")
+            for col, what_if_col in zip(model.features, what_if_cols)
+        }
+        start = time.perf_counter()
+        predicted = model.predict(pd.DataFrame([student])).iloc[0]
+        elapsed = time.perf_counter() - start
+        metric_cols = st.columns(len(predicted))
+        for metric_col, (label, value) in zip(metric_cols, predicted.items()):
+            metric_col.metric(label, f"{value:.1f}")
+        st.caption(f"Predicted in {elapsed * 1000:.2f} ms")
 
 else:
     st.info("📥 Please upload an Excel file to get started.")
 
+profiling.finish()
+
@@ -0,0 +1,145 @@
+"""Headless batch reports for a directory of student performance workbooks.
+
+Usage:
+    python batch_reports.py INPUT_DIR [-o OUTPUT_DIR] [-j JOBS] [--force]
+
+Each workbook gets the same summary statistics, group averages and
+correlation heatmap as the dashboard, written as CSV, PNG and HTML under
+OUTPUT_DIR/<workbook name>/. Workbooks whose content hash matches the last
+run's manifest and whose report is still there are skipped.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import seaborn as sns
+from matplotlib.figure import Figure
+
+from student_data import file_hash, group_average, prepare_scores, score_correlation
+
+MANIFEST = "manifest.json"
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+<h1>📊 {title}</h1>
+<p>{students} students</p>
+<h2>📈 Summary Statistics</h2>
+{summary}
+<h2>Average Score by Gender</h2>
+{gender}
+<h2>Average Score by Test Preparation</h2>
+{prep}
+<h2>Correlation Heatmap</h2>
+<img src="correlation_heatmap.png" alt="Correlation heatmap">
+</body>
+</html>
+"""
+
+
+def write_report(df, out_dir, title):
+    out_dir.mkdir(parents=True, exist_ok=True)
+    summary = df.describe()
+    gender_avg = group_average(df, "Gender")
+    prep_avg = group_average(df, "Test Preparation")
+    corr = score_correlation(df)
+
+    summary.to_csv(out_dir / "summary.csv")
+    gender_avg.to_csv(out_dir / "average_by_gender.csv")
+    prep_avg.to_csv(out_dir / "average_by_test_preparation.csv")
+    corr.to_csv(out_dir / "correlation.csv")
+
+    # Object-oriented figure: no pyplot state shared between reports
+    fig = Figure()
+    ax = fig.subplots()
+    sns.heatmap(corr, annot=True, cmap="coolwarm", ax=ax)
+    fig.savefig(out_dir / "correlation_heatmap.png", bbox_inches="tight")
+
+    html = HTML_TEMPLATE.format(
+        title=title,
+        students=len(df),
+        summary=summary.to_html(float_format="{:.2f}".format),
+        gender=gender_avg.to_frame().to_html(float_format="{:.2f}".format),
+        prep=prep_avg.to_frame().to_html(float_format="{:.2f}".format),
+    )
+    (out_dir / "report.html").write_text(html, encoding="utf-8")
+
+
+def process_workbook(path, out_root, previous_hash):
+    """Build one workbook's report unless its content is unchanged and the report still exists."""
+    raw_bytes = Path(path).read_bytes()
+    content_hash = file_hash(raw_bytes)
+    out_dir = Path(out_root) / Path(path).stem
+    if content_hash == previous_hash and (out_dir / "report.html").exists():
+        return path, content_hash, "skipped"
+    try:
+        df = prepare_scores(raw_bytes)
+        write_report(df, out_dir, Path(path).stem)
+    except Exception as e:
+        return path, None, f"failed: {e}"
+    return path, content_hash, "built"
+
+
+def load_manifest(out_root):
+    try:
+        return json.loads((out_root / MANIFEST).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(out_root, manifest):
+    tmp = out_root / (MANIFEST + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp, out_root / MANIFEST)
+
+
+def run(input_dir, out_root, pattern="student_performance_*.xlsx", jobs=None, force=False):
+    out_root.mkdir(parents=True, exist_ok=True)
+    manifest = {} if force else load_manifest(out_root)
+    workbooks = sorted(str(p) for p in Path(input_dir).glob(pattern))
+    jobs = jobs or os.cpu_count()
+    chunksize = max(1, len(workbooks) // (jobs * 4))
+
+    counts = {"built": 0, "skipped": 0, "failed": 0}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(process_workbook, workbooks,
+                           [str(out_root)] * len(workbooks),
+                           [manifest.get(Path(p).name) for p in workbooks],
+                           chunksize=chunksize)
+        for path, content_hash, status in results:
+            name = Path(path).name
+            if content_hash is None:
+                counts["failed"] += 1
+                manifest.pop(name, None)
+                print(f"{name}: {status}", file=sys.stderr)
+                continue
+            counts[status] += 1
+            manifest[name] = content_hash
+    save_manifest(out_root, manifest)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build student performance reports for a directory of workbooks.")
+    parser.add_argument("input_dir", type=Path)
+    parser.add_argument("-o", "--output-dir", type=Path, default=Path("reports"))
+    parser.add_argument("-p", "--pattern", default="student_performance_*.xlsx")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="rebuild every workbook, ignoring the manifest")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    counts = run(args.input_dir, args.output_dir, args.pattern, args.jobs, args.force)
+    elapsed = time.perf_counter() - start
+    print(f"{counts['built']} built, {counts['skipped']} unchanged, {counts['failed']} failed in {elapsed:.1f}s")
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
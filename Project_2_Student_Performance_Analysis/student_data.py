@@ -0,0 +1,65 @@
+"""Parsing and cleaning of student performance workbooks."""
+
+import hashlib
+import io
+
+import numpy as np
+import pandas as pd
+
+SCORE_COLUMNS = ["Math Score", "Reading Score", "Writing Score"]
+CATEGORY_COLUMNS = ["Gender", "Ethnicity", "Test Preparation"]
+REPORT_COLUMNS = SCORE_COLUMNS + ["Average Score"]
+
+# Histogram grids for exact quartiles from accumulators: integer scores and
+# averages of three integer scores
+SCORE_GRIDS = {col: (0, 1, 101) for col in SCORE_COLUMNS}
+SCORE_GRIDS["Average Score"] = (0, 1 / 3, 301)
+
+
+def file_hash(raw_bytes):
+    """Content hash used to key cached work on an uploaded workbook."""
+    return hashlib.sha256(raw_bytes).hexdigest()
+
+
+def _small_ints(scores):
+    values = scores.to_numpy()
+    if np.all(np.mod(values, 1) == 0) and values.min() >= 0 and values.max() <= np.iinfo(np.uint8).max:
+        return scores.astype(np.uint8)
+    return scores.astype(np.float32)
+
+
+def prepare_cohort(raw_bytes):
+    """Parse a workbook of students; score columns may be absent."""
+    df = pd.read_excel(io.BytesIO(raw_bytes))
+
+    # Clean column names
+    df.columns = df.columns.str.strip()
+
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def prepare_scores(raw_bytes):
+    """Parse a workbook into the cleaned, typed frame the dashboard works on."""
+    df = prepare_cohort(raw_bytes)
+
+    # Drop missing values in score columns
+    df = df.dropna(subset=SCORE_COLUMNS).reset_index(drop=True)
+
+    for col in SCORE_COLUMNS:
+        df[col] = _small_ints(df[col])
+
+    # Add a new column: Average Score
+    df["Average Score"] = df[SCORE_COLUMNS].mean(axis=1)
+    return df
+
+
+def group_average(df, column):
+    """Mean Average Score per group, lowest first."""
+    return df.groupby(column, observed=True)["Average Score"].mean().sort_values()
+
+
+def score_correlation(df):
+    return df[REPORT_COLUMNS].corr()
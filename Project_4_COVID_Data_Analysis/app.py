@@ -1,83 +1,144 @@
 # app.py
 
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from covid_loaders import RANKED_METRICS, load_data, load_history, load_moments, load_rankings, open_store
+from common.charts import ChartScheduler, subplots
+from common.lazy import lazy_import, preload
+from common import profiling
+from common.table_view import paged_table
+
+sns = lazy_import("seaborn")
 
 # Set Streamlit page configuration
 st.set_page_config(page_title="COVID-19 Analysis", layout="wide")
+profiling.begin("covid")
 
-# Load the dataset
-@st.cache_data
-def load_data():
-    df = pd.read_csv("country_wise_latest.csv")
-    df.columns = [col.strip().replace(" ", "_") for col in df.columns]
-    return df
+# Data source: the static snapshot, or the latest day of the daily store
+store = open_store()
+source = "Snapshot"
+if store.exists():
+    source = st.sidebar.radio("Data source", ["Snapshot", "Daily time series"],
+                              help="Daily time series reads the latest day ingested with covid_store.py")
+version = store.last_date if source == "Daily time series" else None
 
-df = load_data()
+# Load the dataset
+df = load_data(source, version)
+moments = load_moments(source, version, df)
+with profiling.stage("refresh rankings", rows=len(df)):
+    rankings = load_rankings(source, df).refresh(df, version or source)
 
 # Title
 st.title("🌍 COVID-19 Country-wise Data Analysis")
 st.markdown("This dashboard visualizes the latest global COVID-19 data using various charts and insights.")
+preload(sns)
+if version is not None:
+    st.caption(f"Daily time series, latest day: {version:%d %b %Y}")
 
 # Show data on checkbox
 if st.checkbox("Show Raw Data"):
-    st.dataframe(df)
+    paged_table(df, "covid_raw", token=(source, version))
 
 # Summary stats
 st.subheader("🔹 Global Summary")
 col1, col2, col3, col4 = st.columns(4)
-col1.metric("Total Confirmed", int(df['Confirmed'].sum()))
-col2.metric("Total Deaths", int(df['Deaths'].sum()))
-col3.metric("Total Recovered", int(df['Recovered'].sum()))
-col4.metric("Total Active", int(df['Active'].sum()))
+with profiling.stage("global summary", rows=len(df)):
+    col1.metric("Total Confirmed", int(df['Confirmed'].sum()))
+    col2.metric("Total Deaths", int(df['Deaths'].sum()))
+    col3.metric("Total Recovered", int(df['Recovered'].sum()))
+    col4.metric("Total Active", int(df['Active'].sum()))
+
+# The charts below are independent: each is built in the chart pool and shown in its slot
+charts = ChartScheduler()
 
 # Bar chart - Top 10 Countries by Confirmed Cases
-st.subheader("🔸 Top 10 Countries by Confirmed Cases")
-top10 = df.sort_values(by='Confirmed', ascending=False).head(10)
+def top10_confirmed_chart(rankings):
+    top10 = rankings.top('Confirmed', 10)
+
+    fig, ax = subplots(figsize=(10, 5))
+    sns.barplot(x='Confirmed', y='Country/Region', data=top10, palette='Reds_r', ax=ax)
+    ax.set_title("Top 10 Countries with Highest Confirmed Cases")
+    return fig
 
-fig1, ax1 = plt.subplots(figsize=(10, 5))
-sns.barplot(x='Confirmed', y='Country/Region', data=top10, palette='Reds_r', ax=ax1)
-ax1.set_title("Top 10 Countries with Highest Confirmed Cases")
-st.pyplot(fig1)
+st.subheader("🔸 Top 10 Countries by Confirmed Cases")
+charts.add(st, "top 10 confirmed", top10_confirmed_chart, rankings)
 
 # Pie chart - Top 5 Deaths Share
-st.subheader("🔸 Death Share of Top 5 Countries")
-top5_deaths = df.sort_values(by='Deaths', ascending=False).head(5)
+def top5_deaths_chart(rankings):
+    top5_deaths = rankings.top('Deaths', 5)
 
-fig2, ax2 = plt.subplots(figsize=(6, 6))
-ax2.pie(top5_deaths['Deaths'], labels=top5_deaths['Country/Region'], autopct='%1.1f%%',
-        startangle=90, colors=sns.color_palette('pastel'))
-ax2.set_title("Top 5 Countries by Deaths")
-st.pyplot(fig2)
+    fig, ax = subplots(figsize=(6, 6))
+    ax.pie(top5_deaths['Deaths'], labels=top5_deaths['Country/Region'], autopct='%1.1f%%',
+           startangle=90, colors=sns.color_palette('pastel'))
+    ax.set_title("Top 5 Countries by Deaths")
+    return fig
+
+st.subheader("🔸 Death Share of Top 5 Countries")
+charts.add(st, "top 5 deaths", top5_deaths_chart, rankings)
 
 # Scatterplot - Active vs Recovered
+def recovered_active_chart(df):
+    fig, ax = subplots(figsize=(10, 6))
+    sns.scatterplot(x='Recovered', y='Active', data=df, hue='WHO_Region', s=150, edgecolor='black', ax=ax)
+    ax.set_title("Recovered vs Active")
+    return fig
+
 st.subheader("🔸 Recovered vs Active Cases by WHO Region")
-fig3, ax3 = plt.subplots(figsize=(10, 6))
-sns.scatterplot(x='Recovered', y='Active', data=df, hue='WHO_Region', s=150, edgecolor='black', ax=ax3)
-ax3.set_title("Recovered vs Active")
-st.pyplot(fig3)
+charts.add(st, "recovered vs active", recovered_active_chart, df)
 
 # Heatmap - Correlation
+def correlation_chart(moments):
+    fig, ax = subplots(figsize=(6, 4))
+    sns.heatmap(moments.combine().corr(), annot=True, cmap='coolwarm', fmt='.2f', ax=ax)
+    return fig
+
 st.subheader("🔸 Correlation Between Confirmed, Deaths, Recovered, Active")
-fig4, ax4 = plt.subplots(figsize=(6, 4))
-numeric = df[['Confirmed', 'Deaths', 'Recovered', 'Active']]
-sns.heatmap(numeric.corr(), annot=True, cmap='coolwarm', fmt='.2f', ax=ax4)
-st.pyplot(fig4)
+charts.add(st, "correlation heatmap", correlation_chart, moments)
 
 # Region-wise Confirmed Chart
-st.subheader("🔸 WHO Region-wise Total Confirmed Cases")
-region_total = df.groupby('WHO_Region')['Confirmed'].sum().sort_values(ascending=False)
+def region_totals_chart(rankings):
+    region_total = rankings.region_totals('Confirmed')
+
+    fig, ax = subplots(figsize=(8, 4))
+    sns.barplot(x=region_total.index, y=region_total.values, palette='Set3', ax=ax)
+    ax.set_title("Confirmed Cases by WHO Region")
+    ax.set_xlabel("WHO Region")
+    ax.set_ylabel("Confirmed")
+    ax.tick_params(axis='x', labelrotation=45)
+    return fig
 
-fig5, ax5 = plt.subplots(figsize=(8, 4))
-sns.barplot(x=region_total.index, y=region_total.values, palette='Set3', ax=ax5)
-ax5.set_title("Confirmed Cases by WHO Region")
-ax5.set_xlabel("WHO Region")
-ax5.set_ylabel("Confirmed")
-plt.xticks(rotation=45)
-st.pyplot(fig5)
+st.subheader("🔸 WHO Region-wise Total Confirmed Cases")
+charts.add(st, "region totals", region_totals_chart, rankings)
+
+with profiling.stage("render charts"):
+    charts.render()
+
+# Leaderboards by metric and region
+st.subheader("🔸 Leaderboards")
+lb_col1, lb_col2, lb_col3 = st.columns(3)
+lb_metric = lb_col1.selectbox("Rank by", RANKED_METRICS, key="leaderboard_metric",
+                              format_func=lambda col: col.replace("_", " "))
+lb_region = lb_col2.selectbox("WHO Region", [None] + rankings.regions, key="leaderboard_region",
+                              format_func=lambda region: "All regions" if region is None else region)
+lb_size = lb_col3.slider("Countries", 5, 25, 10, key="leaderboard_size")
+with profiling.stage("leaderboard"):
+    leaders = rankings.top(lb_metric, lb_size, lb_region)
+    leaders.index = range(1, len(leaders) + 1)
+    st.dataframe(leaders[['Country/Region', 'WHO_Region', lb_metric]])
+
+# Daily trends from the time-series store
+if version is not None:
+    st.subheader("🔸 Daily Trends")
+    trend_metrics = ["New cases", "7 day cases", "14 day cases", "New deaths", "7 day deaths", "7 day growth %"]
+    history = load_history(tuple(trend_metrics), version)
+    countries = st.multiselect("Countries", sorted(history["Country/Region"].unique()),
+                               default=df.nlargest(3, "Confirmed")["Country/Region"].tolist())
+    metric = st.selectbox("Metric", trend_metrics, index=1)
+    with profiling.stage("chart: daily trends", rows=len(history)):
+        trend = history[history["Country/Region"].isin(countries)]
+        st.line_chart(trend.pivot(index="Date", columns="Country/Region", values=metric))
 
 # Footer
 st.markdown("---")
 st.markdown("📊 Created by Soubhagya | Covid-19 Analysis | Tamizhan Skills")
+
+profiling.finish()
@@ -0,0 +1,66 @@
+"""Cached loaders behind the COVID dashboard."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from covid_store import SNAPSHOT_FILE, STORE_DIR, CovidStore
+from rankings import RankingIndex
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from common.online_stats import GroupedMoments
+from common import profiling
+from common.warmup import import_modules
+
+DATA_DIR = Path(__file__).resolve().parent
+
+# Leaderboards are slices of precomputed orderings, refreshed when new data arrives
+RANKED_METRICS = ['Confirmed', 'Deaths', 'Recovered', 'Active', 'New_cases', '1_week_%_increase']
+
+
+def open_store():
+    return CovidStore(DATA_DIR / STORE_DIR)
+
+
+# Load the dataset
+@profiling.profiled("load data")
+@st.cache_data
+def load_data(source="Snapshot", version=None):
+    if source == "Daily time series":
+        df = open_store().latest()
+    else:
+        df = pd.read_csv(DATA_DIR / SNAPSHOT_FILE)
+    df.columns = [col.strip().replace(" ", "_") for col in df.columns]
+    return df
+
+
+@profiling.profiled("load history")
+@st.cache_data
+def load_history(columns, version=None):
+    return open_store().history(list(columns))
+
+
+# Running moments per WHO region; correlations merge regions instead of rescanning rows
+@profiling.profiled("build moments", rows=None)
+@st.cache_resource
+def load_moments(source, version, _df):
+    return GroupedMoments.from_frame(_df, ['WHO_Region'], ['Confirmed', 'Deaths', 'Recovered', 'Active'])
+
+
+@st.cache_resource
+def load_rankings(source, _df):
+    return RankingIndex(_df, RANKED_METRICS, key='Country/Region', group='WHO_Region')
+
+
+def warm(step):
+    """Load the snapshot and build its moments and rankings, as the page's first run does."""
+    source, version = "Snapshot", None
+    with step("load data"):
+        df = load_data(source, version)
+    with step("build moments"):
+        load_moments(source, version, df)
+    with step("build rankings"):
+        load_rankings(source, df).refresh(df, version or source)
+    import_modules(step, "matplotlib.pyplot", "seaborn")
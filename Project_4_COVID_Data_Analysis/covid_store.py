@@ -0,0 +1,184 @@
+"""Append-only daily COVID store with incrementally maintained rolling metrics.
+
+Usage:
+    python covid_store.py ingest DAILY_DIR [--store covid_store]
+
+DAILY_DIR holds one cumulative per-country report per day, named
+YYYY-MM-DD.csv or MM-DD-YYYY.csv (the JHU daily report layout). Only days
+after the last ingested one are read. Each day is written once to
+STORE/days/<date>.parquet with the same columns as country_wise_latest.csv
+plus rolling 7/14-day sums and weekly growth. Rolling values come from a
+15-day window of cumulative counts kept in STORE/window.parquet, so a new
+day costs O(countries) no matter how long the history is. Values that need
+a day missing from the reports (the first day, or one after a gap) are
+left empty rather than guessed. STORE and the WHO region snapshot default
+to this script's folder, where the dashboard reads them.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+COUNTS = ["Confirmed", "Deaths", "Recovered"]
+WINDOW_DAYS = 14
+SNAPSHOT_FILE = "country_wise_latest.csv"
+STORE_DIR = "covid_store"
+DATA_DIR = Path(__file__).resolve().parent
+
+_COUNTRY_ALIASES = ["Country/Region", "Country_Region"]
+_DATE_PATTERNS = [
+    (re.compile(r"(\d{4})-(\d{2})-(\d{2})"), lambda m: date(int(m[1]), int(m[2]), int(m[3]))),
+    (re.compile(r"(\d{2})-(\d{2})-(\d{4})"), lambda m: date(int(m[3]), int(m[1]), int(m[2]))),
+]
+
+
+def report_date(path):
+    for pattern, parse in _DATE_PATTERNS:
+        match = pattern.search(Path(path).stem)
+        if match:
+            return parse(match)
+    return None
+
+
+def read_daily_report(path):
+    """Cumulative Confirmed/Deaths/Recovered per country for one report."""
+    df = pd.read_csv(path)
+    df.columns = [col.strip() for col in df.columns]
+    country = next(col for col in _COUNTRY_ALIASES if col in df.columns)
+    df = df.rename(columns={country: "Country/Region"})
+    for col in COUNTS:
+        df[col] = pd.to_numeric(df.get(col, 0), errors="coerce").fillna(0)
+    return df.groupby("Country/Region")[COUNTS].sum().astype(np.int64)
+
+
+def _ratio(numerator, denominator):
+    # Matches country_wise_latest.csv: 0/0 -> 0, x/0 -> inf; unknown (<NA>) -> NaN
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(numerator == 0, 0.0, numerator / denominator * 100)
+    return np.round(ratio, 2)
+
+
+def derive_day(day, today, window, regions):
+    """Snapshot row per country for `day` from its counts and the window."""
+    def lookback(days):
+        # A day or country missing from the window stays <NA>, so differences against it are unknown, not totals
+        past = window[window["Date"] == pd.Timestamp(day - timedelta(days=days))]
+        return past.set_index("Country/Region")[COUNTS].reindex(today.index).astype("Int64")
+
+    yesterday, week_ago, fortnight_ago = lookback(1), lookback(7), lookback(14)
+    out = pd.DataFrame(index=today.index)
+    out[COUNTS] = today
+    out["Active"] = today["Confirmed"] - today["Deaths"] - today["Recovered"]
+    out["New cases"] = today["Confirmed"] - yesterday["Confirmed"]
+    out["New deaths"] = today["Deaths"] - yesterday["Deaths"]
+    out["New recovered"] = today["Recovered"] - yesterday["Recovered"]
+    out["Deaths / 100 Cases"] = _ratio(today["Deaths"], today["Confirmed"])
+    out["Recovered / 100 Cases"] = _ratio(today["Recovered"], today["Confirmed"])
+    out["Deaths / 100 Recovered"] = _ratio(today["Deaths"], today["Recovered"])
+    out["Confirmed last week"] = week_ago["Confirmed"]
+    out["1 week change"] = today["Confirmed"] - week_ago["Confirmed"]
+    out["1 week % increase"] = _ratio(out["1 week change"], out["Confirmed last week"])
+    out["WHO Region"] = regions.reindex(today.index)
+
+    # Rolling sums are differences of cumulative counts
+    out["7 day cases"] = out["1 week change"]
+    out["14 day cases"] = today["Confirmed"] - fortnight_ago["Confirmed"]
+    out["7 day deaths"] = today["Deaths"] - week_ago["Deaths"]
+    out["14 day deaths"] = today["Deaths"] - fortnight_ago["Deaths"]
+    previous_week = week_ago["Confirmed"] - fortnight_ago["Confirmed"]
+    out["7 day growth %"] = _ratio(out["7 day cases"] - previous_week, previous_week)
+    out.insert(0, "Date", pd.Timestamp(day))
+    return out.reset_index()
+
+
+class CovidStore:
+    def __init__(self, root=DATA_DIR / STORE_DIR):
+        self.root = Path(root)
+        self.days_dir = self.root / "days"
+        self.state_path = self.root / "store.json"
+        self.window_path = self.root / "window.parquet"
+
+    def exists(self):
+        return self.state_path.exists()
+
+    @property
+    def last_date(self):
+        if not self.exists():
+            return None
+        return date.fromisoformat(json.loads(self.state_path.read_text())["last_date"])
+
+    def _window(self):
+        if self.window_path.exists():
+            return pd.read_parquet(self.window_path)
+        return pd.DataFrame({"Date": pd.Series(dtype="datetime64[ns]"),
+                             "Country/Region": pd.Series(dtype=str),
+                             **{col: pd.Series(dtype=np.int64) for col in COUNTS}})
+
+    def ingest(self, source_dir, regions):
+        """Append every report newer than the last ingested day; returns the new dates."""
+        last = self.last_date
+        reports = sorted((report_date(p), p) for p in Path(source_dir).glob("*.csv") if report_date(p))
+        reports = [(day, p) for day, p in reports if last is None or day > last]
+        if not reports:
+            return []
+
+        self.days_dir.mkdir(parents=True, exist_ok=True)
+        window = self._window()
+        for day, path in reports:
+            today = read_daily_report(path)
+            derive_day(day, today, window, regions).to_parquet(self.days_dir / f"{day.isoformat()}.parquet", index=False)
+            counts = today.reset_index().assign(Date=pd.Timestamp(day))
+            window = pd.concat([window, counts], ignore_index=True)
+            window = window[window["Date"] >= pd.Timestamp(day - timedelta(days=WINDOW_DAYS))]
+
+        window.to_parquet(self.window_path, index=False)
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"last_date": reports[-1][0].isoformat()}))
+        os.replace(tmp, self.state_path)
+        return [day for day, _ in reports]
+
+    def latest(self):
+        """The most recent day's snapshot table."""
+        return pd.read_parquet(self.days_dir / f"{self.last_date.isoformat()}.parquet")
+
+    def history(self, columns, countries=None):
+        """Selected columns for every stored day, optionally for some countries only."""
+        filters = [("Country/Region", "in", list(countries))] if countries else None
+        df = pd.read_parquet(self.days_dir, columns=["Date", "Country/Region"] + list(columns), filters=filters)
+        return df.sort_values(["Country/Region", "Date"], ignore_index=True)
+
+
+def who_regions(snapshot_path=DATA_DIR / SNAPSHOT_FILE):
+    snapshot = pd.read_csv(snapshot_path)
+    return snapshot.set_index("Country/Region")["WHO Region"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain the daily COVID time-series store.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ingest = sub.add_parser("ingest", help="append new daily reports")
+    ingest.add_argument("source_dir", type=Path)
+    ingest.add_argument("--store", type=Path, default=DATA_DIR / STORE_DIR)
+    ingest.add_argument("--regions", type=Path, default=DATA_DIR / SNAPSHOT_FILE,
+                        help="CSV with Country/Region and WHO Region columns")
+    args = parser.parse_args(argv)
+
+    added = CovidStore(args.store).ingest(args.source_dir, who_regions(args.regions))
+    if added:
+        print(f"Ingested {len(added)} day(s): {added[0]} to {added[-1]}")
+    else:
+        print("Store is up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
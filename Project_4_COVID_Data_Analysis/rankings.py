@@ -0,0 +1,79 @@
+"""Precomputed leaderboards for the COVID dashboard.
+
+`RankingIndex` keeps, for every ranked metric, the countries in descending
+order globally and within each WHO region, so any top-k leaderboard is a
+slice of length k. When a new day arrives only the countries whose values
+changed are moved (binary search + insert), instead of re-sorting.
+"""
+
+import threading
+
+import numpy as np
+
+GLOBAL = None
+
+
+class RankingIndex:
+    def __init__(self, df, metrics, key="Country/Region", group="WHO Region"):
+        self.metrics = list(metrics)
+        self.key = key
+        self.group = group
+        self.version = None
+        self._lock = threading.Lock()
+        self._build(df)
+
+    def _build(self, df):
+        self.table = df.set_index(self.key)[self.metrics + [self.group]].copy()
+        self.regions = sorted(self.table[self.group].dropna().unique())
+        # (metric, region) -> (country keys, negated values), both in rank order
+        self._orders = {}
+        for metric in self.metrics:
+            values = self.table[metric].to_numpy(dtype=float)
+            order = np.argsort(-values, kind="stable")
+            keys = self.table.index.to_numpy()[order]
+            self._orders[metric, GLOBAL] = (keys, -values[order])
+            region_of = self.table[self.group].to_numpy()[order]
+            for region in self.regions:
+                in_region = region_of == region
+                self._orders[metric, region] = (keys[in_region], -values[order][in_region])
+        self._totals = self.table.groupby(self.group)[self.metrics].sum()
+
+    def top(self, metric, k=10, region=GLOBAL):
+        """The k highest-ranked countries for `metric`, optionally within a region."""
+        keys, _ = self._orders[metric, region]
+        return self.table.loc[keys[:k]].reset_index()
+
+    def region_totals(self, metric):
+        return self._totals[metric].sort_values(ascending=False)
+
+    def refresh(self, df, version=None):
+        """Bring the index up to date with `df`, moving only changed countries."""
+        with self._lock:
+            if version is not None and version == self.version:
+                return self
+            new = df.set_index(self.key)[self.metrics + [self.group]]
+            if not new.index.equals(self.table.index) or not new[self.group].equals(self.table[self.group]):
+                self._build(df)
+            else:
+                changed = new.index[(new[self.metrics] != self.table[self.metrics]).any(axis=1)]
+                if len(changed) > len(new) // 8:
+                    self._build(df)
+                elif len(changed):
+                    self._move(new.loc[changed])
+            self.version = version
+            return self
+
+    def _move(self, rows):
+        for country, row in rows.iterrows():
+            region = row[self.group]
+            for metric in self.metrics:
+                value = -float(row[metric])
+                for scope in (GLOBAL, region):
+                    keys, values = self._orders[metric, scope]
+                    at = np.flatnonzero(keys == country)[0]
+                    keys, values = np.delete(keys, at), np.delete(values, at)
+                    # Stable against ties: after every country with an equal value
+                    to = np.searchsorted(values, value, side="right")
+                    self._orders[metric, scope] = (np.insert(keys, to, country), np.insert(values, to, value))
+            self.table.loc[country, self.metrics] = row[self.metrics]
+        self._totals = self.table.groupby(self.group)[self.metrics].sum()
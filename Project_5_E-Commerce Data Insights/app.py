@@ -1,9 +1,16 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import plotly.colors as colors
 from datetime import datetime
+from ecommerce_loaders import DATA_FILE, load_data, load_forecast_book
+from sales_forecast import month_span, monthly_series
+from common import profiling
+from common.charts import ChartScheduler
+from common.lazy import lazy_import, preload
+from common.table_view import paged_table
+
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+colors = lazy_import("plotly.colors")
 
 # Page configuration
 st.set_page_config(
@@ -12,21 +19,12 @@ st.set_page_config(
     layout="centered",
     initial_sidebar_state="expanded"
 )
+profiling.begin("ecommerce")
+preload(px, go, colors)
 
-# Load data
-@st.cache_data
-def load_data():
-    return pd.read_csv("Sample - Superstore.csv", encoding='latin-1')
-
+# Load data (dates are parsed inside the cached loader)
 data = load_data()
 
-# Data preprocessing
-data['Order Date'] = pd.to_datetime(data['Order Date'])
-data['Ship Date'] = pd.to_datetime(data['Ship Date'])
-data['Order Month'] = data['Order Date'].dt.month
-data['Order Year'] = data['Order Date'].dt.year
-data['Order Day of Week'] = data['Order Date'].dt.dayofweek
-
 # Sidebar filters
 st.sidebar.header("Filters")
 selected_years = st.sidebar.multiselect(
@@ -48,11 +46,14 @@ selected_segments = st.sidebar.multiselect(
 )
 
 # Apply filters
-filtered_data = data[
-    (data['Order Year'].isin(selected_years)) &
-    (data['Category'].isin(selected_categories)) &
-    (data['Segment'].isin(selected_segments))
-]
+with profiling.stage("filter", rows=len(data)):
+    filtered_data = data[
+        (data['Order Year'].isin(selected_years)) &
+        (data['Category'].isin(selected_categories)) &
+        (data['Segment'].isin(selected_segments))
+    ]
+    # Forecasts need every year of history: only the category and segment filters apply
+    forecast_data = data[data['Category'].isin(selected_categories) & data['Segment'].isin(selected_segments)]
 
 # Main dashboard
 st.title("🛍️ E-Commerce Performance Dashboard")
@@ -62,133 +63,192 @@ st.markdown("""
 
 # KPI cards
 col1, col2, col3 = st.columns(3)
-with col1:
-    st.metric("Total Sales", f"${filtered_data['Sales'].sum():,.2f}")
-with col2:
-    st.metric("Total Profit", f"${filtered_data['Profit'].sum():,.2f}")
-with col3:
-    st.metric("Profit Margin", 
-              f"{(filtered_data['Profit'].sum() / filtered_data['Sales'].sum()) * 100:.2f}%")
+with profiling.stage("kpis", rows=len(filtered_data)):
+    with col1:
+        st.metric("Total Sales", f"${filtered_data['Sales'].sum():,.2f}")
+    with col2:
+        st.metric("Total Profit", f"${filtered_data['Profit'].sum():,.2f}")
+    with col3:
+        st.metric("Profit Margin", 
+                  f"{(filtered_data['Profit'].sum() / filtered_data['Sales'].sum()) * 100:.2f}%")
+
+# Chart builders run in the chart pool, each aggregating the filtered frame for its own figure
+def monthly_trend_chart(filtered_data, metric, title, label):
+    by_month = filtered_data.groupby('Order Month')[metric].sum().reset_index()
+    return px.line(by_month, x='Order Month', y=metric, 
+                   title=title,
+                   labels={'Order Month': 'Month', metric: label})
+
+def category_pie_chart(filtered_data, metric, title):
+    by_category = filtered_data.groupby('Category')[metric].sum().reset_index()
+    fig = px.pie(by_category, values=metric, names='Category',
+                 title=title,
+                 hole=0.4)
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+def subcategory_bar_chart(filtered_data, metric, title, scale):
+    by_subcategory = filtered_data.groupby('Sub-Category')[metric].sum().reset_index()
+    return px.bar(by_subcategory.sort_values(metric, ascending=False), 
+                  x='Sub-Category', y=metric,
+                  title=title,
+                  color=metric,
+                  color_continuous_scale=scale)
+
+def segment_totals(filtered_data):
+    return filtered_data.groupby('Segment').agg({'Sales': 'sum', 'Profit': 'sum'}).reset_index()
+
+def segment_bars_chart(filtered_data):
+    sales_profit_by_segment = segment_totals(filtered_data)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=sales_profit_by_segment['Segment'],
+        y=sales_profit_by_segment['Sales'],
+        name='Sales',
+        marker_color=colors.qualitative.Pastel[0]
+    ))
+    fig.add_trace(go.Bar(
+        x=sales_profit_by_segment['Segment'],
+        y=sales_profit_by_segment['Profit'],
+        name='Profit',
+        marker_color=colors.qualitative.Pastel[1]
+    ))
+    fig.update_layout(
+        title='Sales and Profit by Customer Segment',
+        barmode='group'
+    )
+    return fig
+
+def segment_ratio_chart(filtered_data):
+    sales_profit_by_segment = segment_totals(filtered_data)
+    sales_profit_by_segment['Sales_to_Profit_Ratio'] = sales_profit_by_segment['Sales'] / sales_profit_by_segment['Profit']
+    return px.bar(sales_profit_by_segment, 
+                  x='Segment', y='Sales_to_Profit_Ratio',
+                  title='Sales to Profit Ratio by Segment',
+                  labels={'Sales_to_Profit_Ratio': 'Sales/Profit Ratio'})
+
+def forecast_chart(frame, title):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=frame.index, y=frame['Upper'], line=dict(width=0),
+                             showlegend=False, hoverinfo='skip'))
+    fig.add_trace(go.Scatter(x=frame.index, y=frame['Lower'], line=dict(width=0), fill='tonexty',
+                             fillcolor='rgba(99, 110, 250, 0.2)', name='95% band'))
+    fig.add_trace(go.Scatter(x=frame.index, y=frame['Actual'], name='Actual', mode='lines+markers'))
+    fig.add_trace(go.Scatter(x=frame.index, y=frame['Fitted'], name='Fitted', line=dict(dash='dot')))
+    fig.add_trace(go.Scatter(x=frame.index, y=frame['Forecast'], name='Forecast', line=dict(dash='dash')))
+    fig.update_layout(
+        title=f'Monthly Sales Forecast: {title}',
+        xaxis_title='Month',
+        yaxis_title='Sales ($)'
+    )
+    return fig
+
+def state_map_chart(filtered_data):
+    sales_by_region = filtered_data.groupby('State')['Sales'].sum().reset_index()
+    return px.choropleth(sales_by_region,
+                         locations='State',
+                         locationmode='USA-states',
+                         color='Sales',
+                         scope="usa",
+                         color_continuous_scale='Blues',
+                         title='Sales by State')
 
-# Tabs for different analyses
-tab1, tab2, tab3, tab4 = st.tabs(["Sales Analysis", "Profit Analysis", "Segment Analysis", "Geospatial View"])
+# Tabs for different analyses; every chart is built concurrently and shown in its slot
+charts = ChartScheduler()
+tab1, tab2, tab3, tab4, tab5 = st.tabs(["Sales Analysis", "Profit Analysis", "Segment Analysis", "Geospatial View", "Forecast"])
 
 with tab1:
     st.subheader("Sales Performance")
-    
+
     col1, col2 = st.columns(2)
     with col1:
         # Monthly sales trend
-        sales_by_month = filtered_data.groupby('Order Month')['Sales'].sum().reset_index()
-        fig = px.line(sales_by_month, x='Order Month', y='Sales', 
-                     title='Monthly Sales Trend',
-                     labels={'Order Month': 'Month', 'Sales': 'Total Sales ($)'})
-        st.plotly_chart(fig, use_container_width=True)
-    
+        charts.add(col1, "monthly sales", monthly_trend_chart, filtered_data,
+                   'Sales', 'Monthly Sales Trend', 'Total Sales ($)')
+
     with col2:
         # Sales by category
-        sales_by_category = filtered_data.groupby('Category')['Sales'].sum().reset_index()
-        fig = px.pie(sales_by_category, values='Sales', names='Category',
-                    title='Sales Distribution by Category',
-                    hole=0.4)
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig, use_container_width=True)
-    
+        charts.add(col2, "sales by category", category_pie_chart, filtered_data,
+                   'Sales', 'Sales Distribution by Category')
+
     # Sales by sub-category
-    sales_by_subcategory = filtered_data.groupby('Sub-Category')['Sales'].sum().reset_index()
-    fig = px.bar(sales_by_subcategory.sort_values('Sales', ascending=False), 
-                x='Sub-Category', y='Sales',
-                title='Sales by Sub-Category (Top Performers)',
-                color='Sales',
-                color_continuous_scale='Blues')
-    st.plotly_chart(fig, use_container_width=True)
+    charts.add(tab1, "sales by sub-category", subcategory_bar_chart, filtered_data,
+               'Sales', 'Sales by Sub-Category (Top Performers)', 'Blues')
 
 with tab2:
     st.subheader("Profit Analysis")
-    
+
     col1, col2 = st.columns(2)
     with col1:
         # Monthly profit trend
-        profit_by_month = filtered_data.groupby('Order Month')['Profit'].sum().reset_index()
-        fig = px.line(profit_by_month, x='Order Month', y='Profit',
-                     title='Monthly Profit Trend',
-                     labels={'Order Month': 'Month', 'Profit': 'Total Profit ($)'})
-        st.plotly_chart(fig, use_container_width=True)
-    
+        charts.add(col1, "monthly profit", monthly_trend_chart, filtered_data,
+                   'Profit', 'Monthly Profit Trend', 'Total Profit ($)')
+
     with col2:
         # Profit by category
-        profit_by_category = filtered_data.groupby('Category')['Profit'].sum().reset_index()
-        fig = px.pie(profit_by_category, values='Profit', names='Category',
-                    title='Profit Distribution by Category',
-                    hole=0.4)
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig, use_container_width=True)
-    
+        charts.add(col2, "profit by category", category_pie_chart, filtered_data,
+                   'Profit', 'Profit Distribution by Category')
+
     # Profit by sub-category
-    profit_by_subcategory = filtered_data.groupby('Sub-Category')['Profit'].sum().reset_index()
-    fig = px.bar(profit_by_subcategory.sort_values('Profit', ascending=False), 
-                x='Sub-Category', y='Profit',
-                title='Profit by Sub-Category',
-                color='Profit',
-                color_continuous_scale='Greens')
-    st.plotly_chart(fig, use_container_width=True)
+    charts.add(tab2, "profit by sub-category", subcategory_bar_chart, filtered_data,
+               'Profit', 'Profit by Sub-Category', 'Greens')
 
 with tab3:
     st.subheader("Customer Segment Analysis")
-    
+
     # Sales and profit by segment
-    sales_profit_by_segment = filtered_data.groupby('Segment').agg({'Sales': 'sum', 'Profit': 'sum'}).reset_index()
-    
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        x=sales_profit_by_segment['Segment'],
-        y=sales_profit_by_segment['Sales'],
-        name='Sales',
-        marker_color=colors.qualitative.Pastel[0]
-    ))
-    fig.add_trace(go.Bar(
-        x=sales_profit_by_segment['Segment'],
-        y=sales_profit_by_segment['Profit'],
-        name='Profit',
-        marker_color=colors.qualitative.Pastel[1]
-    ))
-    fig.update_layout(
-        title='Sales and Profit by Customer Segment',
-        barmode='group'
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
+    charts.add(tab3, "segment sales and profit", segment_bars_chart, filtered_data)
+
     # Sales to profit ratio
-    sales_profit_by_segment['Sales_to_Profit_Ratio'] = sales_profit_by_segment['Sales'] / sales_profit_by_segment['Profit']
-    fig = px.bar(sales_profit_by_segment, 
-                x='Segment', y='Sales_to_Profit_Ratio',
-                title='Sales to Profit Ratio by Segment',
-                labels={'Sales_to_Profit_Ratio': 'Sales/Profit Ratio'})
-    st.plotly_chart(fig, use_container_width=True)
+    charts.add(tab3, "segment sales to profit", segment_ratio_chart, filtered_data)
 
 with tab4:
     st.subheader("Geospatial Analysis")
-    
+
     # Sales by state/region
-    sales_by_region = filtered_data.groupby('State')['Sales'].sum().reset_index()
-    
-    fig = px.choropleth(sales_by_region,
-                       locations='State',
-                       locationmode='USA-states',
-                       color='Sales',
-                       scope="usa",
-                       color_continuous_scale='Blues',
-                       title='Sales by State')
-    st.plotly_chart(fig, use_container_width=True)
+    charts.add(tab4, "sales by state", state_map_chart, filtered_data)
+
+with tab5:
+    st.subheader("Sales Forecast")
+    st.markdown("""
+        Monthly sales per sub-category and state (or region), projected from each series' trend and
+        month-of-year seasonality. Forecasts use every year, filtered by category and segment.
+    """)
+
+    col1, col2 = st.columns(2)
+    forecast_level = col1.radio("Series by", ["State", "Region"], horizontal=True, key="forecast_level")
+    horizon = col2.slider("Months ahead", 3, 12, 6, key="forecast_horizon")
+
+    if forecast_data.empty:
+        st.info("No orders match the selected categories and segments.")
+    else:
+        # Every series is fitted; a series whose history is unchanged reuses its cached model
+        with profiling.stage("forecast", rows=len(forecast_data)):
+            first, periods = month_span(data['Order Date'])
+            series = monthly_series(forecast_data, forecast_level, first, periods)
+            forecast = load_forecast_book().fit(series, first)
+            summary = forecast.summary(horizon).sort_values(f"Next {horizon} months", ascending=False)
+        st.caption(f"{len(series):,} series, {forecast.refit:,} refitted in {forecast.seconds * 1000:,.0f} ms; "
+                   "the rest reused cached fits.")
+        st.dataframe(summary, height=300, width="stretch")
+
+        # Drill-down into one series
+        keys = {" · ".join(key): key for key in summary.index}
+        label = st.selectbox("Series", list(keys), key="forecast_series")
+        charts.add(tab5, "forecast drill-down", forecast_chart, forecast.drill_down(keys[label], horizon), label)
+
+with profiling.stage("render charts"):
+    charts.render()
 
 # Additional features
 st.sidebar.header("Additional Options")
 show_raw_data = st.sidebar.checkbox("Show raw data")
 if show_raw_data:
     st.subheader("Raw Data")
-    st.dataframe(data)
+    paged_table(data, "ecommerce_raw", token=DATA_FILE)
 
 # Download button for filtered data
+@profiling.profiled("export csv", rows=None)
 @st.cache_data
 def convert_df(df):
     return df.to_csv().encode('utf-8')
@@ -222,4 +282,6 @@ st.sidebar.info(
     This dashboard analyzes Superstore sales data to identify trends and opportunities.
     Use the filters to explore different dimensions of the data.
     """
-)
\ No newline at end of file
+)
+
+profiling.finish()
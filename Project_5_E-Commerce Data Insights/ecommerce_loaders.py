@@ -0,0 +1,44 @@
+"""Cached loaders behind the e-commerce dashboard."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from sales_forecast import ForecastBook, month_span, monthly_series
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from common import profiling
+from common.warmup import import_modules
+
+DATA_DIR = Path(__file__).resolve().parent
+DATA_FILE = DATA_DIR / "Sample - Superstore.csv"
+
+
+# Orders with parsed dates and their calendar parts, derived once per load
+@profiling.profiled("load data")
+@st.cache_data
+def load_data():
+    data = pd.read_csv(DATA_FILE, encoding='latin-1')
+    data['Order Date'] = pd.to_datetime(data['Order Date'])
+    data['Ship Date'] = pd.to_datetime(data['Ship Date'])
+    data['Order Month'] = data['Order Date'].dt.month
+    data['Order Year'] = data['Order Date'].dt.year
+    data['Order Day of Week'] = data['Order Date'].dt.dayofweek
+    return data
+
+
+# Per-series forecast models shared by every session, reused while a series' history is unchanged
+@st.cache_resource
+def load_forecast_book():
+    return ForecastBook()
+
+
+def warm(step):
+    with step("load data"):
+        data = load_data()
+    with step("fit forecasts"):
+        first, periods = month_span(data['Order Date'])
+        load_forecast_book().fit(monthly_series(data, "State", first, periods), first)
+    import_modules(step, "plotly.express", "plotly.graph_objects")
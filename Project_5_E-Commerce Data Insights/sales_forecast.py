@@ -0,0 +1,197 @@
+"""Monthly sales forecasts for every Sub-Category × State (or Region) series.
+
+Orders are summed into one year-month series per combination, over the
+months the whole dataset spans. Each series gets a linear trend plus
+month-of-year seasonal terms, fitted by least squares with a ridge penalty
+on the seasonal terms only, so sparse series fall back to their trend. All
+series share one design matrix, which makes fitting a batch of series a
+single linear solve with one right-hand side per series.
+
+ForecastBook keeps fitted coefficients keyed by a fingerprint of each
+series' history. When the input changes (new orders, other filters), only
+series whose history differs are refitted, in batches spread over a
+thread pool (NumPy's linear algebra releases the GIL).
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+SEASONAL_ALPHA = 1.0
+# Fewer changed series than this are fitted on the calling thread: handing them off costs more than the fit
+BATCH_SERIES = 256
+MAX_CACHED = 50_000
+Z95 = 1.96
+
+_lock = threading.Lock()
+_pool = None
+
+
+def month_index(dates):
+    """Months since year 0 of each date."""
+    return dates.dt.year.to_numpy(np.int64) * 12 + dates.dt.month.to_numpy(np.int64) - 1
+
+
+def month_span(dates):
+    """(first month index, number of months) covered by `dates`."""
+    months = month_index(dates)
+    return int(months.min()), int(months.max() - months.min() + 1)
+
+
+def month_labels(first, periods):
+    return pd.period_range(pd.Period(year=first // 12, month=first % 12 + 1, freq="M"), periods=periods, freq="M")
+
+
+def monthly_series(df, level, first, periods):
+    """Sales per (Sub-Category, `level`) and month: one row per series, `periods` columns from month `first`."""
+    month = month_index(df["Order Date"]) - first
+    keep = (month >= 0) & (month < periods)
+    sales = (pd.DataFrame({
+        "Sub-Category": df["Sub-Category"].to_numpy()[keep],
+        level: df[level].to_numpy()[keep],
+        "Month": month[keep],
+        "Sales": df["Sales"].to_numpy(np.float64)[keep],
+    }).groupby(["Sub-Category", level, "Month"])["Sales"].sum())
+    return sales.unstack("Month", fill_value=0.0).reindex(columns=range(periods), fill_value=0.0)
+
+
+def design(first, periods):
+    """Intercept, trend in years and 11 month-of-year indicators (January is the baseline)."""
+    t = np.arange(periods)
+    month = (first + t) % 12
+    x = np.zeros((periods, 13))
+    x[:, 0] = 1
+    x[:, 1] = t / 12
+    x[t[month > 0], 1 + month[month > 0]] = 1
+    return x
+
+
+def fit_batch(x, y, alpha=SEASONAL_ALPHA):
+    """Coefficients (series × terms) and residual sd of every row of `y` regressed on `x`."""
+    penalty = np.diag([1e-9, 1e-9] + [alpha] * (x.shape[1] - 2))
+    coef = np.linalg.solve(x.T @ x + penalty, x.T @ y.T).T
+    residual = y - coef @ x.T
+    dof = max(x.shape[0] - x.shape[1], 1)
+    return coef, np.sqrt((residual ** 2).sum(axis=1) / dof)
+
+
+def _executor(jobs=None):
+    global _pool
+    with _lock:
+        if _pool is None:
+            # Threads, not processes: spawned workers would re-run the Streamlit script as __main__
+            _pool = ThreadPoolExecutor(max_workers=jobs or min(4, os.cpu_count() or 1),
+                                       thread_name_prefix="forecast")
+        return _pool
+
+
+class Forecast:
+    """Fitted models for a set of series, with their history."""
+
+    def __init__(self, series, first, coef, sigma, refit, seconds):
+        self.series = series
+        self.first = first
+        self.coef = coef
+        self.sigma = sigma
+        self.refit = refit
+        self.seconds = seconds
+
+    @property
+    def periods(self):
+        return self.series.shape[1]
+
+    def predict(self, horizon):
+        """Forecast sales (series × `horizon` months), floored at zero."""
+        future = design(self.first, self.periods + horizon)[self.periods:]
+        return np.maximum(self.coef @ future.T, 0)
+
+    def summary(self, horizon):
+        """Per series: sales over the last 12 months, the next `horizon` months' forecast and its change."""
+        actual = self.series.to_numpy()
+        last_year = actual[:, -12:].sum(axis=1)
+        ahead = self.predict(horizon).sum(axis=1)
+        same_months = actual[:, -12:][:, :horizon].sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = np.where(same_months > 0, (ahead / same_months - 1) * 100, np.nan)
+        return pd.DataFrame({
+            "Last 12 months": last_year,
+            f"Next {horizon} months": ahead,
+            "Change vs last year %": change,
+            "Monthly error (sd)": self.sigma,
+        }, index=self.series.index)
+
+    def drill_down(self, key, horizon):
+        """One series' actual, fitted and forecast sales by month, with a 95% band."""
+        row = self.series.index.get_loc(key)
+        x = design(self.first, self.periods + horizon)
+        line = x @ self.coef[row]
+        band = Z95 * self.sigma[row]
+        history = np.full(self.periods + horizon, np.nan)
+        history[:self.periods] = self.series.to_numpy()[row]
+        forecast = np.full(self.periods + horizon, np.nan)
+        # Start the forecast at the last actual month so the lines join
+        forecast[self.periods - 1:] = np.maximum(line[self.periods - 1:], 0)
+        return pd.DataFrame({
+            "Actual": history,
+            "Fitted": np.where(np.arange(len(line)) < self.periods, line, np.nan),
+            "Forecast": forecast,
+            "Lower": np.maximum(forecast - band, 0),
+            "Upper": forecast + band,
+        }, index=month_labels(self.first, self.periods + horizon).to_timestamp())
+
+
+class ForecastBook:
+    """Fitted series models keyed by a fingerprint of their history; least recently used are evicted."""
+
+    def __init__(self, alpha=SEASONAL_ALPHA, max_cached=MAX_CACHED):
+        self.alpha = alpha
+        self.max_cached = max_cached
+        self._fits = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _fingerprint(self, first, values):
+        digest = hashlib.blake2b(repr((first, len(values), self.alpha)).encode(), digest_size=16)
+        digest.update(values.tobytes())
+        return digest.digest()
+
+    def fit(self, series, first, jobs=None):
+        """A Forecast for every row of `series` (from monthly_series), refitting only unseen histories."""
+        start = time.perf_counter()
+        y = np.ascontiguousarray(series.to_numpy(np.float64))
+        prints = [self._fingerprint(first, row) for row in y]
+        with self._lock:
+            cached = {fp: self._fits[fp] for fp in prints if fp in self._fits}
+        todo = {fp: i for i, fp in enumerate(prints) if fp not in cached}
+
+        fitted = {}
+        if todo:
+            x = design(first, y.shape[1])
+            rows = list(todo.values())
+            batches = [y[rows[i:i + BATCH_SERIES]] for i in range(0, len(rows), BATCH_SERIES)]
+            if len(batches) > 1:
+                results = list(_executor(jobs).map(fit_batch, repeat(x), batches, repeat(self.alpha)))
+            else:
+                results = [fit_batch(x, batches[0], self.alpha)]
+            coef = np.concatenate([c for c, _ in results])
+            sigma = np.concatenate([s for _, s in results])
+            fitted = {fp: (coef[n], sigma[n]) for n, fp in enumerate(todo)}
+
+        fits = [cached[fp] if fp in cached else fitted[fp] for fp in prints]
+        # Insert, refresh and evict in one hold: another session's eviction can't interleave
+        with self._lock:
+            for fp, fit in zip(prints, fits):
+                self._fits[fp] = fit
+                self._fits.move_to_end(fp)
+            while len(self._fits) > self.max_cached:
+                self._fits.popitem(last=False)
+
+        coef = np.stack([c for c, _ in fits]) if fits else np.zeros((0, 13))
+        sigma = np.array([s for _, s in fits])
+        return Forecast(series, first, coef, sigma, refit=len(todo), seconds=time.perf_counter() - start)
@@ -1,8 +1,14 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
+from sketches import merge_partitions, AGE_BAND
+from netflix_loaders import DATA_FILE, load_data, load_sketches
+from common import profiling
+from common.charts import ChartScheduler, subplots
+from common.lazy import lazy_import, preload
+from common.table_view import paged_table
+
+sns = lazy_import("seaborn")
+px = lazy_import("plotly.express")
 
 # Set page config
 st.set_page_config(
@@ -11,17 +17,159 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
+profiling.begin("netflix")
+preload(sns, px)
 
-# Load data
-@st.cache_data
-def load_data():
-    return pd.read_excel("Dim_User.xlsx")
+# Chart builders run in the chart pool: each draws on its own figure, never on pyplot's
+def country_bars(top_countries):
+    fig, ax = subplots(figsize=(7,6))
+    sns.barplot(x=top_countries.values, y=top_countries.index, palette='Set2', ax=ax)
+    ax.set_title("Top 10 Countries by User Count")
+    ax.set_xlabel("No. of Users")
+    ax.set_ylabel("Country")
+    return fig
 
-df = load_data()
+def genre_gender_heatmap(heatmap_data):
+    fig, ax = subplots(figsize=(8,6))
+    sns.heatmap(heatmap_data, annot=True, fmt='d', cmap='YlGnBu', ax=ax)
+    ax.set_title("Genre Preference by Gender")
+    return fig
+
+def top_countries_chart(filtered_df):
+    return country_bars(filtered_df['Country'].value_counts().head(10))
+
+def gender_chart(filtered_df):
+    gender_counts = filtered_df['Gender'].value_counts()
+    fig, ax = subplots(figsize=(5,2))
+    ax.pie(gender_counts, labels=gender_counts.index, 
+           autopct='%1.1f%%', startangle=90, 
+           colors=sns.color_palette('pastel'))
+    ax.set_title("Gender Distribution")
+    return fig
+
+def genres_chart(filtered_df):
+    fig, ax = subplots(figsize=(8,6.5))
+    sns.countplot(data=filtered_df, y='Genre', 
+                 order=filtered_df['Genre'].value_counts().index, 
+                 palette='husl', ax=ax)
+    ax.set_title("Most Preferred Genres")
+    ax.set_xlabel("User Count")
+    ax.set_ylabel("Genre")
+    return fig
+
+def genre_by_gender_chart(filtered_df):
+    fig = genre_gender_heatmap(pd.crosstab(filtered_df['Genre'], filtered_df['Gender']))
+    ax = fig.axes[0]
+    ax.set_ylabel("Genre")
+    ax.set_xlabel("Gender")
+    return fig
+
+def age_groups_chart(filtered_df):
+    fig, ax = subplots(figsize=(8,5))
+    sns.countplot(x='AgeGroup', data=filtered_df, palette='Purples', ax=ax)
+    ax.set_title("User Distribution by Age Group")
+    ax.set_xlabel("Age Group")
+    ax.set_ylabel("No. of Users")
+    return fig
+
+def watch_time_chart(filtered_df):
+    fig, ax = subplots(figsize=(8,5))
+    sns.scatterplot(x='Age', y='TimeConsumingPerWeek', hue='Gender', 
+                    data=filtered_df, palette='Set1', s=100, 
+                    edgecolor='black', ax=ax)
+    ax.set_title("Watch Time vs Age by Gender")
+    ax.set_xlabel("Age")
+    ax.set_ylabel("Time Spent on Netflix per Week")
+    ax.grid(True)
+    return fig
+
+def age_histogram_chart(filtered_df):
+    return px.histogram(filtered_df, x='Age', nbins=20, 
+                        color='Gender', barmode='overlay',
+                        title="Age Distribution by Gender")
+
+def country_map_chart(filtered_df):
+    country_counts = filtered_df['Country'].value_counts().reset_index()
+    country_counts.columns = ['Country', 'Users']
+    return px.choropleth(country_counts, 
+                         locations='Country',
+                         locationmode='country names',
+                         color='Users',
+                         hover_name='Country',
+                         color_continuous_scale='Viridis',
+                         title="User Distribution by Country")
+
+def watch_time_scatter_chart(filtered_df):
+    return px.scatter(filtered_df, x='Age', y='TimeConsumingPerWeek',
+                      color='Gender', size='TimeConsumingPerWeek',
+                      hover_data=['Country', 'Genre'],
+                      title="Interactive Age vs Watch Time Analysis")
+
+def render_approximate_view():
+    partitions = load_sketches()
+    countries = sorted({key[0] for key in partitions})
+    genders = sorted({key[1] for key in partitions})
+    bands = sorted({int(key[2]) for key in partitions})
+
+    selected_countries = st.sidebar.multiselect("Select Countries", options=countries)
+    selected_genders = st.sidebar.multiselect("Select Genders", options=genders, default=genders)
+    age_range = st.sidebar.slider(
+        "Select Age Band",
+        min_value=bands[0],
+        max_value=bands[-1],
+        value=(bands[0], bands[-1]),
+        step=AGE_BAND
+    )
+    with profiling.stage("merge sketches") as merge_stage:
+        sketch = merge_partitions(partitions, selected_countries, selected_genders, age_range)
+        merge_stage.rows = sketch.rows
+
+    st.title("📊 Netflix User Analytics Dashboard")
+    st.markdown(f"""
+Approximate mode: metrics are merged from {len(partitions):,} per-partition sketches
+(ages {age_range[0]}–{age_range[1] + AGE_BAND - 1}, in {AGE_BAND}-year bands).
+""")
+    if sketch.rows == 0:
+        st.warning("No users match the selected filters.")
+        return
+
+    # Key metrics with error bounds
+    st.subheader("Key Metrics")
+    users = sketch.users.estimate()
+    top_genres = sketch.genres.top()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Users", f"≈ {users:,.0f}",
+                help=f"HyperLogLog estimate, ±{2 * sketch.users.relative_error * users:,.0f} at ~95%")
+    col2.metric("Average Age", f"{sketch.age_sum / sketch.rows:.1f} years")
+    col3.metric("Avg Weekly Watch Time", f"{sketch.watch_sum / sketch.rows:.1f} hours")
+    col4.metric("Top Genre", top_genres.index[0],
+                help=f"Count-Min estimate {top_genres.iloc[0]:,}, overcounts by at most {sketch.genres.error_bound:,.0f}")
+
+    charts = ChartScheduler()
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Top Countries**")
+        charts.add(col1, "top countries", country_bars, sketch.countries.top(10))
+        st.caption(f"Counts may overcount by up to {sketch.countries.error_bound:,.0f} "
+                   f"(probability {1 - sketch.countries.sketch.delta:.0%}).")
 
-# Data preprocessing
-df['AgeGroup'] = pd.cut(df['Age'], bins=[0, 18, 25, 35, 50, 100],
-                       labels=['<18', '18–25', '26–35', '36–50', '50+'])
+    with col2:
+        st.markdown("**Genre Preference by Gender**")
+        charts.add(col2, "genre by gender", genre_gender_heatmap, sketch.genre_by_gender())
+        st.caption(f"Cells may overcount by up to {sketch.genre_gender.error_bound:,.0f} "
+                   f"(probability {1 - sketch.genre_gender.sketch.delta:.0%}).")
+    with profiling.stage("render charts"):
+        charts.render()
+
+# Approximate mode skips loading the full table
+if st.sidebar.checkbox("Approximate mode (sketches)", help="Stream the user table once into mergeable sketches"):
+    st.sidebar.header("Filters")
+    render_approximate_view()
+    profiling.finish()
+    st.stop()
+
+# Load data (age groups are derived inside the cached loader)
+df = load_data()
 
 # Sidebar filters
 st.sidebar.header("Filters")
@@ -45,12 +193,14 @@ age_range = st.sidebar.slider(
 )
 
 # Filter data based on selections
-filtered_df = df[
-    (df['Country'].isin(selected_countries) if selected_countries else df['Country'].notnull()) &
-    (df['Gender'].isin(selected_genders) if selected_genders else df['Gender'].notnull()) &
-    (df['Age'] >= age_range[0]) &
-    (df['Age'] <= age_range[1])
-]
+with profiling.stage("filter", rows=len(df)):
+    filter_mask = (
+        (df['Country'].isin(selected_countries) if selected_countries else df['Country'].notnull()) &
+        (df['Gender'].isin(selected_genders) if selected_genders else df['Gender'].notnull()) &
+        (df['Age'] >= age_range[0]) &
+        (df['Age'] <= age_range[1])
+    )
+    filtered_df = df[filter_mask]
 
 # Main app
 st.title("📊 Netflix User Analytics Dashboard")
@@ -61,129 +211,81 @@ Explore user demographics, preferences, and viewing habits.
 # Key metrics
 st.subheader("Key Metrics")
 col1, col2, col3, col4 = st.columns(4)
-col1.metric("Total Users", len(filtered_df))
-col2.metric("Average Age", f"{filtered_df['Age'].mean():.1f} years")
-col3.metric("Avg Weekly Watch Time", f"{filtered_df['TimeConsumingPerWeek'].mean():.1f} hours")
-col4.metric("Top Genre", filtered_df['Genre'].mode()[0])
+with profiling.stage("key metrics", rows=len(filtered_df)):
+    col1.metric("Total Users", len(filtered_df))
+    col2.metric("Average Age", f"{filtered_df['Age'].mean():.1f} years")
+    col3.metric("Avg Weekly Watch Time", f"{filtered_df['TimeConsumingPerWeek'].mean():.1f} hours")
+    col4.metric("Top Genre", filtered_df['Genre'].mode()[0])
 
-# Visualization tabs
+# Visualization tabs; every chart is built concurrently and shown in its slot
+charts = ChartScheduler()
 tab1, tab2, tab3, tab4 = st.tabs(["Demographics", "Genre Preferences", "Age Analysis", "Interactive"])
 
 with tab1:
     st.subheader("User Demographics")
-    
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         st.markdown("**Top Countries**")
-        top_countries = filtered_df['Country'].value_counts().head(10)
-        fig, ax = plt.subplots(figsize=(7,6))
-        sns.barplot(x=top_countries.values, y=top_countries.index, palette='Set2', ax=ax)
-        plt.title("Top 10 Countries by User Count")
-        plt.xlabel("No. of Users")
-        plt.ylabel("Country")
-        st.pyplot(fig)
-    
+        charts.add(col1, "top countries", top_countries_chart, filtered_df)
+
     with col2:
         st.markdown("**Gender Distribution**")
-        gender_counts = filtered_df['Gender'].value_counts()
-        fig, ax = plt.subplots(figsize=(5,2))
-        ax.pie(gender_counts, labels=gender_counts.index, 
-               autopct='%1.1f%%', startangle=90, 
-               colors=sns.color_palette('pastel'))
-        plt.title("Gender Distribution")
-        st.pyplot(fig)
+        charts.add(col2, "gender distribution", gender_chart, filtered_df)
 
 with tab2:
     st.subheader("Genre Preferences")
-    
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         st.markdown("**Most Preferred Genres**")
-        fig, ax = plt.subplots(figsize=(8,6.5))
-        sns.countplot(data=filtered_df, y='Genre', 
-                     order=filtered_df['Genre'].value_counts().index, 
-                     palette='husl', ax=ax)
-        plt.title("Most Preferred Genres")
-        plt.xlabel("User Count")
-        plt.ylabel("Genre")
-        st.pyplot(fig)
-    
+        charts.add(col1, "preferred genres", genres_chart, filtered_df)
+
     with col2:
         st.markdown("**Genre Preference by Gender**")
-        heatmap_data = pd.crosstab(filtered_df['Genre'], filtered_df['Gender'])
-        fig, ax = plt.subplots(figsize=(8,6))
-        sns.heatmap(heatmap_data, annot=True, fmt='d', cmap='YlGnBu', ax=ax)
-        plt.title("Genre Preference by Gender")
-        plt.ylabel("Genre")
-        plt.xlabel("Gender")
-        st.pyplot(fig)
+        charts.add(col2, "genre by gender", genre_by_gender_chart, filtered_df)
 
 with tab3:
     st.subheader("Age Analysis")
-    
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         st.markdown("**Age Group Distribution**")
-        fig, ax = plt.subplots(figsize=(8,5))
-        sns.countplot(x='AgeGroup', data=filtered_df, palette='Purples', ax=ax)
-        plt.title("User Distribution by Age Group")
-        plt.xlabel("Age Group")
-        plt.ylabel("No. of Users")
-        st.pyplot(fig)
-    
+        charts.add(col1, "age groups", age_groups_chart, filtered_df)
+
     with col2:
         st.markdown("**Watch Time vs Age**")
-        fig, ax = plt.subplots(figsize=(8,5))
-        sns.scatterplot(x='Age', y='TimeConsumingPerWeek', hue='Gender', 
-                        data=filtered_df, palette='Set1', s=100, 
-                        edgecolor='black', ax=ax)
-        plt.title("Watch Time vs Age by Gender")
-        plt.xlabel("Age")
-        plt.ylabel("Time Spent on Netflix per Week")
-        plt.grid(True)
-        st.pyplot(fig)
+        charts.add(col2, "watch time vs age", watch_time_chart, filtered_df)
 
 with tab4:
     st.subheader("Interactive Visualizations")
-    
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         st.markdown("**Interactive Age Distribution**")
-        fig = px.histogram(filtered_df, x='Age', nbins=20, 
-                          color='Gender', barmode='overlay',
-                          title="Age Distribution by Gender")
-        st.plotly_chart(fig, use_container_width=True)
-    
+        charts.add(col1, "age histogram", age_histogram_chart, filtered_df)
+
     with col2:
         st.markdown("**Country Distribution**")
-        country_counts = filtered_df['Country'].value_counts().reset_index()
-        country_counts.columns = ['Country', 'Users']
-        fig = px.choropleth(country_counts, 
-                           locations='Country',
-                           locationmode='country names',
-                           color='Users',
-                           hover_name='Country',
-                           color_continuous_scale='Viridis',
-                           title="User Distribution by Country")
-        st.plotly_chart(fig, use_container_width=True)
-    
+        charts.add(col2, "country map", country_map_chart, filtered_df)
+
     st.markdown("**Age vs Watch Time Interactive**")
-    fig = px.scatter(filtered_df, x='Age', y='TimeConsumingPerWeek',
-                    color='Gender', size='TimeConsumingPerWeek',
-                    hover_data=['Country', 'Genre'],
-                    title="Interactive Age vs Watch Time Analysis")
-    st.plotly_chart(fig, use_container_width=True)
+    charts.add(tab4, "watch time scatter", watch_time_scatter_chart, filtered_df)
+
+with profiling.stage("render charts"):
+    charts.render()
 
 # Raw data view
 st.subheader("Raw Data")
 if st.checkbox("Show raw data"):
-    st.dataframe(filtered_df)
+    paged_table(df, "netflix_raw", token=DATA_FILE, mask=filter_mask)
 
 # Download button
+@profiling.profiled("export csv", rows=None)
 @st.cache_data
 def convert_df(df):
     return df.to_csv().encode('utf-8')
@@ -194,4 +296,6 @@ st.download_button(
     data=csv,
     file_name='filtered_netflix_users.csv',
     mime='text/csv'
-)
\ No newline at end of file
+)
+
+profiling.finish()
\ No newline at end of file
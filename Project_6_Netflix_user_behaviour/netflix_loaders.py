@@ -0,0 +1,41 @@
+"""Cached loaders behind the Netflix dashboard."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from sketches import build_partitions, iter_chunks
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from common import profiling
+from common.warmup import import_modules
+
+DATA_DIR = Path(__file__).resolve().parent
+DATA_FILE = DATA_DIR / "Dim_User.xlsx"
+
+
+# Users with their age group, derived once per load
+@profiling.profiled("load data")
+@st.cache_data
+def load_data():
+    df = pd.read_excel(DATA_FILE)
+    df['AgeGroup'] = pd.cut(df['Age'], bins=[0, 18, 25, 35, 50, 100],
+                           labels=['<18', '18–25', '26–35', '36–50', '50+'])
+    return df
+
+
+@profiling.profiled("build sketches", rows=None)
+@st.cache_resource
+def load_sketches(path=DATA_FILE):
+    return build_partitions(iter_chunks(path))
+
+
+def warm(step):
+    """Load the full table and build the approximate mode's sketches."""
+    with step("load data"):
+        load_data()
+    with step("build sketches"):
+        load_sketches()
+    import_modules(step, "matplotlib.pyplot", "seaborn", "plotly.express")
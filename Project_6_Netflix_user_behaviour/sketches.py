@@ -0,0 +1,255 @@
+"""Mergeable sketches for approximate Netflix user analytics.
+
+The dashboard's exact metrics (distinct users, top countries, top genres and
+the genre-by-gender crosstab) need the whole user table in memory. The
+sketches here are built in one streaming pass over chunked input, one set per
+partition (Country x Gender x age band), and merged on demand for whatever
+the sidebar filters select.
+"""
+
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+AGE_BAND = 5
+PARTITION_COLUMNS = ["Country", "Gender"]
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def hash_values(values):
+    """Stable 64-bit hashes for a column of values."""
+    values = np.asarray(values)
+    if values.dtype.kind not in "iub":
+        values = values.astype(object)
+    return pd.util.hash_array(values)
+
+
+def hash_pairs(left, right):
+    """Combine two columns' hashes into one hash per (left, right) pair."""
+    return hash_values(left) ^ (hash_values(right) * _GOLDEN)
+
+
+def _leading_zeros(x):
+    # Branch-free count of leading zeros for a uint64 array
+    x = x.astype(np.uint64, copy=True)
+    n = np.zeros(x.shape, dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        empty = (x >> np.uint64(64 - shift)) == 0
+        n[empty] += shift
+        x[empty] <<= np.uint64(shift)
+    n[x == 0] = 64
+    return n
+
+
+class HyperLogLog:
+    """Distinct counter with relative standard error 1.04 / sqrt(2 ** p)."""
+
+    def __init__(self, p=11):
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    def add_hashes(self, hashes):
+        if len(hashes) == 0:
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.intp)
+        rank = np.minimum(_leading_zeros(hashes << np.uint64(self.p)), 64 - self.p) + 1
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    @property
+    def relative_error(self):
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)
+        return float(raw)
+
+
+class CountMinSketch:
+    """Frequency table whose estimates overcount by at most epsilon * total
+    with probability 1 - delta."""
+
+    def __init__(self, width=128, depth=4):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+
+    def _columns(self, hashes):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        low = hashes & np.uint64(0xFFFFFFFF)
+        high = hashes >> np.uint64(32)
+        return [((low + np.uint64(i) * high) % np.uint64(self.width)).astype(np.intp)
+                for i in range(self.depth)]
+
+    def add_hashes(self, hashes):
+        for row, columns in enumerate(self._columns(hashes)):
+            self.table[row] += np.bincount(columns, minlength=self.width)
+        self.total += len(hashes)
+
+    def estimate(self, hashes):
+        rows = [self.table[row, columns] for row, columns in enumerate(self._columns(hashes))]
+        return np.min(rows, axis=0)
+
+    def merge(self, other):
+        self.table += other.table
+        self.total += other.total
+        return self
+
+    @property
+    def epsilon(self):
+        return math.e / self.width
+
+    @property
+    def delta(self):
+        return math.exp(-self.depth)
+
+
+class HeavyHitters:
+    """Count-Min sketch plus a bounded set of candidate keys for top-k queries."""
+
+    def __init__(self, capacity=64, width=128, depth=4):
+        self.capacity = capacity
+        self.sketch = CountMinSketch(width, depth)
+        self.candidates = {}
+
+    def add(self, keys, hashes):
+        self.sketch.add_hashes(hashes)
+        unique, first = np.unique(hashes, return_index=True)
+        for h, i in zip(unique.tolist(), first.tolist()):
+            self.candidates.setdefault(h, keys[i])
+        self._trim()
+
+    def merge(self, other):
+        self.sketch.merge(other.sketch)
+        for h, key in other.candidates.items():
+            self.candidates.setdefault(h, key)
+        self._trim()
+        return self
+
+    def _trim(self):
+        if len(self.candidates) <= self.capacity:
+            return
+        hashes = np.fromiter(self.candidates, dtype=np.uint64, count=len(self.candidates))
+        keep = np.argsort(-self.sketch.estimate(hashes), kind="stable")[:self.capacity]
+        self.candidates = {int(hashes[i]): self.candidates[int(hashes[i])] for i in keep}
+
+    def top(self, k=None):
+        """Candidate keys and estimated counts, most frequent first."""
+        if not self.candidates:
+            return pd.Series(dtype="int64")
+        hashes = np.fromiter(self.candidates, dtype=np.uint64, count=len(self.candidates))
+        counts = pd.Series(self.sketch.estimate(hashes),
+                           index=[self.candidates[int(h)] for h in hashes])
+        counts = counts.sort_values(ascending=False, kind="stable")
+        return counts if k is None else counts.head(k)
+
+    @property
+    def error_bound(self):
+        return self.sketch.epsilon * self.sketch.total
+
+
+class UserSketch:
+    """All sketches for one partition of the user table."""
+
+    def __init__(self):
+        self.rows = 0
+        self.age_sum = 0
+        self.watch_sum = 0
+        self.users = HyperLogLog()
+        self.countries = HeavyHitters()
+        self.genres = HeavyHitters()
+        self.genre_gender = HeavyHitters(capacity=128)
+
+    def update(self, chunk):
+        genres = chunk["Genre"].to_numpy(dtype=object)
+        genders = chunk["Gender"].to_numpy(dtype=object)
+        countries = chunk["Country"].to_numpy(dtype=object)
+        self.rows += len(chunk)
+        self.age_sum += int(chunk["Age"].sum())
+        self.watch_sum += int(chunk["TimeConsumingPerWeek"].sum())
+        self.users.add_hashes(hash_values(chunk["User ID"].to_numpy()))
+        self.countries.add(countries, hash_values(countries))
+        self.genres.add(genres, hash_values(genres))
+        self.genre_gender.add(list(zip(genres, genders)), hash_pairs(genres, genders))
+
+    def merge(self, other):
+        self.rows += other.rows
+        self.age_sum += other.age_sum
+        self.watch_sum += other.watch_sum
+        self.users.merge(other.users)
+        self.countries.merge(other.countries)
+        self.genres.merge(other.genres)
+        self.genre_gender.merge(other.genre_gender)
+        return self
+
+    def genre_by_gender(self):
+        counts = self.genre_gender.top()
+        if counts.empty:
+            return pd.DataFrame(dtype="int64")
+        counts.index = pd.MultiIndex.from_tuples(counts.index, names=["Genre", "Gender"])
+        return counts.unstack(fill_value=0)
+
+
+def iter_chunks(path, chunksize=100_000):
+    """Yield the user table in DataFrame chunks without loading it whole."""
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        yield from pd.read_csv(path, chunksize=chunksize)
+        return
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True)
+    rows = workbook.active.iter_rows(values_only=True)
+    header = [str(col).strip() for col in next(rows)]
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == chunksize:
+            yield pd.DataFrame(batch, columns=header)
+            batch = []
+    if batch:
+        yield pd.DataFrame(batch, columns=header)
+    workbook.close()
+
+
+def age_band(age):
+    return (np.asarray(age) // AGE_BAND) * AGE_BAND
+
+
+def build_partitions(chunks):
+    """One streaming pass: {(country, gender, age band): UserSketch}."""
+    partitions = {}
+    for chunk in chunks:
+        chunk = chunk.dropna(subset=["User ID", "Country", "Gender", "Age"])
+        bands = age_band(chunk["Age"].to_numpy())
+        for key, index in chunk.groupby(PARTITION_COLUMNS + [bands], sort=False).indices.items():
+            partitions.setdefault(key, UserSketch()).update(chunk.iloc[index])
+    return partitions
+
+
+def merge_partitions(partitions, countries=None, genders=None, age_range=None):
+    """Merge the partitions selected by the dashboard filters into one sketch."""
+    merged = UserSketch()
+    for (country, gender, band), sketch in partitions.items():
+        if countries and country not in countries:
+            continue
+        if genders and gender not in genders:
+            continue
+        if age_range and not (age_range[0] <= band <= age_range[1]):
+            continue
+        merged.merge(sketch)
+    return merged
@@ -1,19 +1,20 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import plotly.express as px
-from sklearn.cluster import DBSCAN
-from sklearn.ensemble import IsolationForest
-from prophet import Prophet
-import folium
-from streamlit_folium import st_folium
-from folium.plugins import HeatMap
 from datetime import datetime, timedelta
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut
 import time
 import warnings
+from traffic_loaders import DEFAULT_CITY, DEFAULT_DAYS, generate_india_traffic_data
+from common import profiling
+from common.lazy import lazy_import, preload
+
+# Mapping, modelling and plotting libraries load when their tab first needs them
+plt = lazy_import("matplotlib.pyplot")
+px = lazy_import("plotly.express")
+cluster = lazy_import("sklearn.cluster")
+ensemble = lazy_import("sklearn.ensemble")
+prophet = lazy_import("prophet")
+folium = lazy_import("folium")
+folium_plugins = lazy_import("folium.plugins")
+streamlit_folium = lazy_import("streamlit_folium")
 warnings.filterwarnings('ignore')
 
 # Configure the app
@@ -23,6 +24,7 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
+profiling.begin("traffic")
 
 # Custom CSS for styling
 st.markdown("""
@@ -107,90 +109,17 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# ====================== DATA GENERATION ======================
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def generate_india_traffic_data(num_points=10000, days_history=7, city="Delhi"):
-    """Generate realistic traffic data for Indian cities"""
-    try:
-        # Get city coordinates with error handling
-        geolocator = Nominatim(user_agent="india_traffic_app")
-        try:
-            location = geolocator.geocode(city + ", India", timeout=10)
-            if not location:
-                st.warning(f"Could not geocode {city}, using Delhi as default")
-                location = geolocator.geocode("Delhi, India")
-        except GeocoderTimedOut:
-            st.warning("Geocoding timed out, using Delhi coordinates")
-            location = geolocator.geocode("Delhi, India")
-            
-        if not location:
-            raise ValueError("Could not geocode location")
-            
-        base_lat, base_lon = location.latitude, location.longitude
-        
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_history)
-        
-        np.random.seed(42)
-        timestamps = pd.date_range(start_date, end_date, periods=num_points)
-        
-        # Indian vehicle distribution (adjusted for India)
-        vehicle_types = ['car', 'motorcycle', 'truck', 'bus', 'auto']
-        vehicle_probs = [0.5, 0.3, 0.1, 0.05, 0.05]
-        
-        data = pd.DataFrame({
-            'timestamp': timestamps,
-            'latitude': base_lat + np.random.normal(0, 0.02, num_points),
-            'longitude': base_lon + np.random.normal(0, 0.02, num_points),
-            'speed': np.random.uniform(5, 60, num_points),  # km/h
-            'vehicle_type': np.random.choice(vehicle_types, num_points, p=vehicle_probs)
-        })
-        
-        # Indian traffic patterns (longer rush hours)
-        for day in range(days_history):
-            day_date = start_date + timedelta(days=day)
-            day_mask = (timestamps >= day_date) & (timestamps < day_date + timedelta(days=1))
-            
-            # Weekday vs weekend patterns
-            if day_date.weekday() < 5:  # Weekday
-                morning_rush = ((timestamps.hour >= 7) & (timestamps.hour <= 11))  # 7-11am
-                evening_rush = ((timestamps.hour >= 16) & (timestamps.hour <= 21))  # 4-9pm
-                data.loc[day_mask & (morning_rush | evening_rush), 'speed'] *= np.random.uniform(0.2, 0.4)
-            else:  # Weekend
-                afternoon_slow = ((timestamps.hour >= 12) & (timestamps.hour <= 19))
-                data.loc[day_mask & afternoon_slow, 'speed'] *= np.random.uniform(0.5, 0.7)
-        
-        # Add random incidents (higher probability during rush hours)
-        incident_prob = 0.002 * (1 + np.sin(timestamps.hour * np.pi / 12))
-        incidents = np.random.random(len(data)) < incident_prob
-        data.loc[incidents, 'speed'] *= np.random.uniform(0.1, 0.3)
-        
-        return data, base_lat, base_lon
-    
-    except Exception as e:
-        st.error(f"Error generating data: {str(e)}")
-        # Return default Delhi data if error occurs
-        base_lat, base_lon = 28.6139, 77.2090
-        data = pd.DataFrame({
-            'timestamp': pd.date_range(end_date - timedelta(days=days_history), end_date, periods=num_points),
-            'latitude': base_lat + np.random.normal(0, 0.02, num_points),
-            'longitude': base_lon + np.random.normal(0, 0.02, num_points),
-            'speed': np.random.uniform(5, 60, num_points),
-            'vehicle_type': np.random.choice(vehicle_types, num_points, p=vehicle_probs)
-        })
-        return data, base_lat, base_lon
-
 # ====================== SIDEBAR CONTROLS ======================
 with st.sidebar:
     st.header("⚙️ Control Panel")
     
     # City search
     st.subheader("City Selection")
-    city_search = st.text_input("Search any city in India", "Bhubaneswar", 
+    city_search = st.text_input("Search any city in India", DEFAULT_CITY, 
                               help="Enter any Indian city name")
     
     # Data controls
-    days_history = st.slider("Days of history to analyze", 1, 30, 7)
+    days_history = st.slider("Days of history to analyze", 1, 30, DEFAULT_DAYS)
     refresh_data = st.button("🔄 Refresh Data", help="Generate fresh traffic data")
     
     # Analysis parameters
@@ -265,6 +194,9 @@ with col4:
     </div>
     """, unsafe_allow_html=True)
 
+# Metric cards are on screen: warm up the tab libraries in the background
+preload(folium, folium_plugins, streamlit_folium, cluster, px, ensemble, prophet, plt)
+
 # ====================== MAIN TABS ======================
 tab1, tab2, tab3, tab4 = st.tabs(["🌍 Live Map", "📈 Trends", "⚠️ Alerts", "🔮 Forecast"])
 
@@ -283,7 +215,8 @@ with tab1:
         "Last 24 hours": 24,
         "All data": 24 * days_history
     }
-    filtered_df = traffic_df[traffic_df['timestamp'] >= datetime.now() - timedelta(hours=time_map[time_window])]
+    with profiling.stage("time filter", rows=len(traffic_df)):
+        filtered_df = traffic_df[traffic_df['timestamp'] >= datetime.now() - timedelta(hours=time_map[time_window])]
     
     # Create the map
     m = folium.Map(location=[base_lat, base_lon], 
@@ -293,7 +226,7 @@ with tab1:
     
     # Add heatmap if enabled
     if show_heatmap and len(filtered_df) > 0:
-        HeatMap(filtered_df[['latitude', 'longitude', 'speed']].values,
+        folium_plugins.HeatMap(filtered_df[['latitude', 'longitude', 'speed']].values,
                radius=10,
                gradient={0.2: 'blue', 0.4: 'lime', 0.6: 'orange', 1: 'red'},
                blur=15).add_to(m)
@@ -304,53 +237,58 @@ with tab1:
         slow_traffic = filtered_df[filtered_df['speed'] < speed_threshold]
         if len(slow_traffic) > 0:
             coords = slow_traffic[['latitude', 'longitude']].values
-            db = DBSCAN(eps=0.02, min_samples=20).fit(coords)
+            with profiling.stage("DBSCAN clustering", rows=len(coords)):
+                db = cluster.DBSCAN(eps=0.02, min_samples=20).fit(coords)
             slow_traffic['cluster'] = db.labels_
             
-            for _, row in slow_traffic.iterrows():
-                folium.CircleMarker(
-                    location=[row['latitude'], row['longitude']],
-                    radius=5,
-                    color='red' if row['cluster'] == -1 else 'blue',
-                    fill=True,
-                    fill_opacity=0.7,
-                    popup=f"Speed: {row['speed']:.1f} km/h\nType: {row['vehicle_type']}\nTime: {row['timestamp']}"
-                ).add_to(m)
+            with profiling.stage("cluster markers", rows=len(slow_traffic)):
+                for _, row in slow_traffic.iterrows():
+                    folium.CircleMarker(
+                        location=[row['latitude'], row['longitude']],
+                        radius=5,
+                        color='red' if row['cluster'] == -1 else 'blue',
+                        fill=True,
+                        fill_opacity=0.7,
+                        popup=f"Speed: {row['speed']:.1f} km/h\nType: {row['vehicle_type']}\nTime: {row['timestamp']}"
+                    ).add_to(m)
     
     # Display the map
-    st_folium(m, width=1200, height=600, returned_objects=[])
+    with profiling.stage("render live map"):
+        streamlit_folium.st_folium(m, width=1200, height=600, returned_objects=[])
 
 with tab2:
     st.header(f"📈 Traffic Trends Analysis - {city_search}")
     
     # Add temporal aggregations
-    traffic_df['hour'] = traffic_df['timestamp'].dt.hour
-    traffic_df['day_of_week'] = traffic_df['timestamp'].dt.day_name()
-    traffic_df['date'] = traffic_df['timestamp'].dt.date
+    with profiling.stage("trend features", rows=len(traffic_df)):
+        traffic_df['hour'] = traffic_df['timestamp'].dt.hour
+        traffic_df['day_of_week'] = traffic_df['timestamp'].dt.day_name()
+        traffic_df['date'] = traffic_df['timestamp'].dt.date
     
     # Plot hourly patterns
-    st.subheader("Hourly Speed Patterns")
-    fig1 = px.line(traffic_df.groupby(['day_of_week', 'hour'])['speed'].mean().reset_index(),
-                 x='hour', y='speed', color='day_of_week',
-                 title='Average Speed by Hour and Day of Week',
-                 labels={'hour': 'Hour of Day', 'speed': 'Speed (km/h)'})
-    fig1.add_hline(y=speed_threshold, line_dash="dash", line_color="red", 
-                  annotation_text="Congestion Threshold", 
-                  annotation_position="bottom right")
-    st.plotly_chart(fig1, use_container_width=True)
+    with profiling.stage("chart: trends", rows=len(traffic_df)):
+        st.subheader("Hourly Speed Patterns")
+        fig1 = px.line(traffic_df.groupby(['day_of_week', 'hour'])['speed'].mean().reset_index(),
+                     x='hour', y='speed', color='day_of_week',
+                     title='Average Speed by Hour and Day of Week',
+                     labels={'hour': 'Hour of Day', 'speed': 'Speed (km/h)'})
+        fig1.add_hline(y=speed_threshold, line_dash="dash", line_color="red", 
+                      annotation_text="Congestion Threshold", 
+                      annotation_position="bottom right")
+        st.plotly_chart(fig1, use_container_width=True)
     
-    # Vehicle type analysis
-    st.subheader("Vehicle Type Distribution")
-    col1, col2 = st.columns(2)
-    with col1:
-        fig2 = px.pie(traffic_df, names='vehicle_type', 
-                     title='Vehicle Type Distribution')
-        st.plotly_chart(fig2, use_container_width=True)
+        # Vehicle type analysis
+        st.subheader("Vehicle Type Distribution")
+        col1, col2 = st.columns(2)
+        with col1:
+            fig2 = px.pie(traffic_df, names='vehicle_type', 
+                         title='Vehicle Type Distribution')
+            st.plotly_chart(fig2, use_container_width=True)
     
-    with col2:
-        fig3 = px.box(traffic_df, x='vehicle_type', y='speed',
-                     title='Speed Distribution by Vehicle Type')
-        st.plotly_chart(fig3, use_container_width=True)
+        with col2:
+            fig3 = px.box(traffic_df, x='vehicle_type', y='speed',
+                         title='Speed Distribution by Vehicle Type')
+            st.plotly_chart(fig3, use_container_width=True)
 
 with tab3:
     st.header(f"⚠️ Traffic Alerts & Anomalies - {city_search}")
@@ -362,9 +300,10 @@ with tab3:
         traffic_df['time_of_day'] = traffic_df['timestamp'].dt.hour + traffic_df['timestamp'].dt.minute/60
         
         features = traffic_df[['hour', 'latitude', 'longitude', 'speed', 'day_of_week_num', 'is_weekend', 'time_of_day']]
-        model = IsolationForest(contamination=0.01 * anomaly_sensitivity/10, 
-                              random_state=42)
-        traffic_df['anomaly'] = model.fit_predict(features)
+        with profiling.stage("IsolationForest", rows=len(features)):
+            model = ensemble.IsolationForest(contamination=0.01 * anomaly_sensitivity/10, 
+                                  random_state=42)
+            traffic_df['anomaly'] = model.fit_predict(features)
         anomalies = traffic_df[traffic_df['anomaly'] == -1]
         recent_anomalies = anomalies[anomalies['timestamp'] >= datetime.now() - timedelta(hours=24)]
     
@@ -379,18 +318,19 @@ with tab3:
         
         # Anomaly map
         st.subheader("Incident Locations")
-        m_anomalies = folium.Map(location=[base_lat, base_lon], zoom_start=12)
+        with profiling.stage("render incident map", rows=len(recent_anomalies)):
+            m_anomalies = folium.Map(location=[base_lat, base_lon], zoom_start=12)
         
-        for _, row in recent_anomalies.iterrows():
-            folium.CircleMarker(
-                location=[row['latitude'], row['longitude']],
-                radius=8,
-                color='red',
-                fill=True,
-                popup=f"Time: {row['timestamp']}\nSpeed: {row['speed']:.1f} km/h"
-            ).add_to(m_anomalies)
+            for _, row in recent_anomalies.iterrows():
+                folium.CircleMarker(
+                    location=[row['latitude'], row['longitude']],
+                    radius=8,
+                    color='red',
+                    fill=True,
+                    popup=f"Time: {row['timestamp']}\nSpeed: {row['speed']:.1f} km/h"
+                ).add_to(m_anomalies)
         
-        st_folium(m_anomalies, width=1200, height=400)
+            streamlit_folium.st_folium(m_anomalies, width=1200, height=400)
     else:
         st.info("No anomalies detected with current settings")
 
@@ -403,34 +343,37 @@ with tab4:
         hourly_counts.columns = ['ds', 'y']
         
         # Train model
-        model = Prophet(seasonality_mode='multiplicative',
+        model = prophet.Prophet(seasonality_mode='multiplicative',
                        yearly_seasonality=False,
                        weekly_seasonality=True,
                        daily_seasonality=True,
                        changepoint_prior_scale=0.05)
-        model.fit(hourly_counts)
+        with profiling.stage("Prophet fit", rows=len(hourly_counts)):
+            model.fit(hourly_counts)
         
         # Create future dataframe
-        future = model.make_future_dataframe(periods=48, freq='H')
-        forecast = model.predict(future)
+        with profiling.stage("Prophet predict"):
+            future = model.make_future_dataframe(periods=48, freq='H')
+            forecast = model.predict(future)
         
         # Plot forecast
-        st.subheader("48-Hour Traffic Forecast")
-        fig1 = model.plot(forecast)
-        current_time = datetime.now()
-        plt.axvline(x=current_time, color='r', linestyle='--', label='Current Time')
-        plt.title('Predicted Traffic Volume')
-        plt.legend()
-        st.pyplot(fig1)
+        with profiling.stage("chart: forecast"):
+            st.subheader("48-Hour Traffic Forecast")
+            fig1 = model.plot(forecast)
+            current_time = datetime.now()
+            plt.axvline(x=current_time, color='r', linestyle='--', label='Current Time')
+            plt.title('Predicted Traffic Volume')
+            plt.legend()
+            st.pyplot(fig1)
         
-        # Show components
-        st.subheader("Forecast Components")
-        fig2 = model.plot_components(forecast)
-        st.pyplot(fig2)
+            # Show components
+            st.subheader("Forecast Components")
+            fig2 = model.plot_components(forecast)
+            st.pyplot(fig2)
         
-        # Calculate forecast change
-        forecast_change = forecast['yhat'][-48:].mean()/hourly_counts['y'].mean()*100-100
-        st.metric("Forecast Change", f"{forecast_change:.1f}%")
+            # Calculate forecast change
+            forecast_change = forecast['yhat'][-48:].mean()/hourly_counts['y'].mean()*100-100
+            st.metric("Forecast Change", f"{forecast_change:.1f}%")
 
 # ====================== FOOTER ======================
 st.markdown("---")
@@ -439,4 +382,6 @@ st.markdown("""
     <p>India Traffic Analysis Dashboard • Last update: {}</p>
     <p>Data simulated for demonstration purposes • Works with any Indian city</p>
 </div>
-""".format(datetime.now().strftime("%Y-%m-%d %H:%M:%S")), unsafe_allow_html=True)
\ No newline at end of file
+""".format(datetime.now().strftime("%Y-%m-%d %H:%M:%S")), unsafe_allow_html=True)
+
+profiling.finish()
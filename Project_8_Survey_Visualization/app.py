@@ -1,70 +1,104 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
+import numpy as np
+from survey_loaders import data_file, filter_columns, load_data, load_engine, load_filter_stage, load_moments
+from common.lazy import lazy_import, preload
+from common import profiling
+from common.table_view import paged_table
+
+sns = lazy_import("seaborn")
+plt = lazy_import("matplotlib.pyplot")
 
 st.set_page_config(page_title="Survey Data Dashboard", layout="wide")
 st.title("📊 Survey Data Visualization")
+profiling.begin("survey")
+preload(sns, plt)
 
-# Load dataset
-@st.cache_data
-def load_data():
-    return pd.read_csv("survey_data_cleaned.csv")  # Make sure this CSV is in same folder
-
+# Load dataset (the parquet written by clean_survey.py if present, else the CSV)
 df = load_data()
+moments = load_moments(df)
+engine = load_engine(df)
+stage = load_filter_stage(engine, filter_columns(df))
+selection = {}
+predicates = {}
 
 # Show raw data
 if st.checkbox("Show Raw Data"):
     st.write("### Raw Survey Data")
-    st.dataframe(df)
+    paged_table(df, "survey_raw", token=data_file())
 
 # Sidebar filters
 st.sidebar.header("🔍 Filter Options")
 
 # Gender filter
 if "Gender" in df.columns:
-    genders = st.sidebar.multiselect("Select Gender:", df["Gender"].dropna().unique(), default=df["Gender"].dropna().unique())
-    df = df[df["Gender"].isin(genders)]
+    gender_options = list(stage.labels["Gender"])
+    genders = st.sidebar.multiselect("Select Gender:", gender_options, default=gender_options)
+    selection["Gender"] = genders
+    predicates["Gender"] = genders
 
 # Age filter (if Age column exists)
 if "Age" in df.columns:
-    min_age, max_age = int(df["Age"].min()), int(df["Age"].max())
+    ages = stage.labels["Age"]
+    min_age, max_age = int(np.nanmin(ages)), int(np.nanmax(ages))
     age_range = st.sidebar.slider("Select Age Range:", min_value=min_age, max_value=max_age, value=(min_age, max_age))
-    df = df[(df["Age"] >= age_range[0]) & (df["Age"] <= age_range[1])]
+    selection["Age"] = range(age_range[0], age_range[1] + 1)
+    predicates["Age"] = age_range
+
+# All predicates as one mask, then every chart aggregate from one pass over the survivors
+with profiling.stage("filter and aggregate", rows=stage.n):
+    aggregates = stage.apply(predicates)
+st.sidebar.caption(f"{aggregates.n:,} of {stage.n:,} responses · scanned {aggregates.rows_scanned:,} rows, "
+                   f"allocated {aggregates.bytes_allocated / 1024:,.1f} KB")
 
 # Preferred platform distribution
 st.subheader("📱 Preferred Platform")
 if "preferred_platform" in df.columns:
-    fig1, ax1 = plt.subplots()
-    sns.countplot(data=df, x="preferred_platform", palette="cool", ax=ax1)
-    ax1.set_title("Distribution of Preferred Platforms")
-    st.pyplot(fig1)
+    with profiling.stage("chart: preferred platform"):
+        platform_counts = aggregates.counts("preferred_platform")
+        fig1, ax1 = plt.subplots()
+        ax1.bar(platform_counts.index.astype(str), platform_counts.values,
+                color=sns.color_palette("cool", len(platform_counts)))
+        ax1.set_xlabel("preferred_platform")
+        ax1.set_ylabel("count")
+        ax1.set_title("Distribution of Preferred Platforms")
+        st.pyplot(fig1)
 else:
     st.warning("Column 'preferred_platform' not found in the dataset.")
 
 # Age distribution histogram
 st.subheader("🎂 Age Distribution")
 if "Age" in df.columns:
-    fig2, ax2 = plt.subplots()
-    sns.histplot(df["Age"], kde=True, bins=20, color="skyblue", ax=ax2)
-    ax2.set_title("Age Distribution of Survey Participants")
-    st.pyplot(fig2)
+    with profiling.stage("chart: age distribution"):
+        age_counts, age_edges = aggregates.histogram("Age", bins=20)
+        age_grid, age_density = aggregates.kde("Age")
+        fig2, ax2 = plt.subplots()
+        ax2.bar(age_edges[:-1], age_counts, width=np.diff(age_edges), align="edge",
+                color="skyblue", alpha=0.75, edgecolor="white")
+        # Scale the density to the histogram's counts, as histplot does
+        ax2.plot(age_grid, age_density * age_counts.sum() * np.diff(age_edges[:2]), color="skyblue")
+        ax2.set_xlabel("Age")
+        ax2.set_ylabel("Count")
+        ax2.set_title("Age Distribution of Survey Participants")
+        st.pyplot(fig2)
 
 # Gender-wise platform preference
 st.subheader("📊 Gender vs Platform")
 if "Gender" in df.columns and "preferred_platform" in df.columns:
-    fig3, ax3 = plt.subplots()
-    sns.countplot(data=df, x="preferred_platform", hue="Gender", ax=ax3)
-    ax3.set_title("Platform Preference by Gender")
-    st.pyplot(fig3)
+    with profiling.stage("chart: gender vs platform"):
+        platform_by_gender = aggregates.crosstab("preferred_platform", "Gender")
+        fig3, ax3 = plt.subplots()
+        platform_by_gender.plot.bar(ax=ax3, rot=0, width=0.8)
+        ax3.set_ylabel("count")
+        ax3.set_title("Platform Preference by Gender")
+        st.pyplot(fig3)
 
 # Correlation heatmap if numerical columns exist
 st.subheader("📈 Correlation Heatmap")
-numerical_cols = df.select_dtypes(include=['int64', 'float64']).columns
-if len(numerical_cols) >= 2:
-    fig4, ax4 = plt.subplots()
-    sns.heatmap(df[numerical_cols].corr(), annot=True, cmap="coolwarm", ax=ax4)
-    st.pyplot(fig4)
+if len(moments.columns) >= 2:
+    with profiling.stage("chart: correlation heatmap"):
+        fig4, ax4 = plt.subplots()
+        sns.heatmap(moments.combine(selection).corr(), annot=True, cmap="coolwarm", ax=ax4)
+        st.pyplot(fig4)
 else:
     st.warning("Not enough numerical columns for correlation heatmap.")
 
@@ -72,3 +106,5 @@ else:
 st.markdown("---")
 st.markdown("Developed by **Soubhagya | RISE Internship | Tamizhan Skills**")
 
+profiling.finish()
+
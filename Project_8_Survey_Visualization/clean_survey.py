@@ -0,0 +1,227 @@
+"""Streaming cleaning pipeline for raw survey response exports.
+
+Usage:
+    python clean_survey.py RAW.csv [RAW2.csv ...] [-o survey_data_cleaned.parquet]
+        [--csv survey_data_cleaned.csv] [--summary survey_summary.xlsx]
+        [--chunksize 100000] [--jobs N]
+
+The parquet and summary default to this script's folder, where the dashboard
+reads them.
+
+Raw exports are read in chunks and each chunk is validated against SCHEMA in
+a process pool: column names are resolved through their aliases, numbers are
+coerced and range-checked, and categorical answers are normalized. Cleaned
+chunks are appended to a parquet file (and optionally a CSV) as they arrive,
+while running statistics feed a summary workbook written in openpyxl's
+write-only mode. Memory is bounded by chunksize x jobs, not by input size.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from common.online_stats import Moments
+
+# Canonical column -> validation rules. Numbers are rounded to "dtype";
+# "grid" is the (start, width, bins) histogram used for exact quartiles in
+# the summary.
+SCHEMA = {
+    "Age": {"kind": "number", "aliases": ["age", "Age (years)", "respondent_age"],
+            "min": 10, "max": 110, "dtype": "int64", "grid": (0, 1, 121)},
+    "Gender": {"kind": "category", "aliases": ["gender", "sex", "Sex"],
+               "values": {"male": "Male", "m": "Male", "man": "Male",
+                          "female": "Female", "f": "Female", "woman": "Female",
+                          "other": "Other", "non-binary": "Other", "nonbinary": "Other",
+                          "prefer not to say": "Other"}},
+    "Satisfaction": {"kind": "number", "aliases": ["satisfaction", "satisfaction_score", "Rating"],
+                     "min": 1, "max": 5, "dtype": "int64", "grid": (0, 1, 11)},
+    "preferred_platform": {"kind": "category", "aliases": ["Device", "device", "platform", "Platform",
+                                                          "Preferred Platform"]},
+    "Response_Time": {"kind": "number", "aliases": ["response_time", "Response Time", "ResponseTime"],
+                      "min": 0, "max": 3600, "dtype": "int64", "grid": (0, 1, 3601)},
+}
+
+NUMERIC_COLUMNS = [col for col, rule in SCHEMA.items() if rule["kind"] == "number"]
+CATEGORY_COLUMNS = [col for col, rule in SCHEMA.items() if rule["kind"] == "category"]
+DATA_DIR = Path(__file__).resolve().parent
+
+
+def arrow_schema():
+    """Parquet schema of a cleaned chunk, fixed by SCHEMA rather than inferred from the data."""
+    import pyarrow as pa
+
+    return pa.schema([(col, pa.from_numpy_dtype(np.dtype(rule["dtype"])) if rule["kind"] == "number" else pa.string())
+                      for col, rule in SCHEMA.items()])
+
+
+def resolve_columns(columns):
+    """Map raw column names to canonical ones via SCHEMA aliases."""
+    lookup = {}
+    for col, rule in SCHEMA.items():
+        for name in [col] + rule["aliases"]:
+            lookup[name.strip().casefold()] = col
+    mapping = {}
+    for raw in columns:
+        canonical = lookup.get(str(raw).strip().casefold())
+        if canonical and canonical not in mapping.values():
+            mapping[raw] = canonical
+    return mapping
+
+
+def normalize_columns(df):
+    """Rename aliased columns (e.g. Device -> preferred_platform) in place of a full clean."""
+    return df.rename(columns=resolve_columns(df.columns))
+
+
+def clean_chunk(chunk):
+    """Validate one chunk: (cleaned frame, Counter of rejection reasons)."""
+    chunk = normalize_columns(chunk)
+    missing = [col for col in SCHEMA if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"missing required column(s): {', '.join(missing)}")
+
+    out = pd.DataFrame(index=chunk.index)
+    valid = np.ones(len(chunk), dtype=bool)
+    reasons = Counter()
+    for col, rule in SCHEMA.items():
+        if rule["kind"] == "number":
+            values = pd.to_numeric(chunk[col], errors="coerce")
+            ok = values.between(rule["min"], rule["max"]).to_numpy()
+        else:
+            text = chunk[col].astype("string").str.strip()
+            if "values" in rule:
+                values = text.str.casefold().map(rule["values"])
+            else:
+                values = text.str.title()
+            ok = (values.notna() & (values != "")).to_numpy(dtype=bool)
+        reasons[f"invalid {col}"] += int((valid & ~ok).sum())
+        valid &= ok
+        out[col] = values
+
+    out = out[valid]
+    for col in NUMERIC_COLUMNS:
+        dtype = SCHEMA[col]["dtype"]
+        out[col] = (out[col].round() if dtype.startswith("int") else out[col]).astype(dtype)
+    for col in CATEGORY_COLUMNS:
+        out[col] = out[col].astype(object)
+    return out.reset_index(drop=True), reasons
+
+
+def iter_raw_chunks(paths, chunksize):
+    for path in paths:
+        yield from pd.read_csv(path, chunksize=chunksize, dtype=str, skipinitialspace=True)
+
+
+def _ordered_map(pool, fn, items, window):
+    """pool.map with at most `window` chunks in flight, results in input order."""
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class SummaryBuilder:
+    """Running aggregates for survey_summary.xlsx."""
+
+    def __init__(self):
+        self.moments = Moments(NUMERIC_COLUMNS, {col: SCHEMA[col]["grid"] for col in NUMERIC_COLUMNS})
+        self.categories = {col: Counter() for col in CATEGORY_COLUMNS}
+        self.rows_read = 0
+        self.rejected = Counter()
+
+    def update(self, cleaned, reasons, rows_read):
+        self.rows_read += rows_read
+        self.rejected.update(reasons)
+        self.moments.update(cleaned[NUMERIC_COLUMNS].to_numpy(dtype=float))
+        for col in CATEGORY_COLUMNS:
+            self.categories[col].update(cleaned[col].value_counts().to_dict())
+
+    def write(self, path):
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        describe = self.moments.describe()
+        sheet.append([None] + list(describe.columns))
+        for stat, row in describe.iterrows():
+            sheet.append([stat] + [None if pd.isna(v) else float(v) for v in row])
+
+        for col, counts in self.categories.items():
+            sheet = workbook.create_sheet(col)
+            sheet.append([col, "count"])
+            for value, count in counts.most_common():
+                sheet.append([value, count])
+
+        sheet = workbook.create_sheet("Validation")
+        sheet.append(["check", "rows"])
+        sheet.append(["rows read", self.rows_read])
+        sheet.append(["rows kept", self.moments.n])
+        for reason, count in sorted(self.rejected.items()):
+            if count:
+                sheet.append([reason, count])
+        workbook.save(path)
+
+
+def run(inputs, parquet_path, csv_path=None, summary_path=None, chunksize=100_000, jobs=None):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    summary = SummaryBuilder()
+    # Inferring the schema from the first chunk fails when that chunk has no valid rows
+    schema = arrow_schema()
+    writer = pq.ParquetWriter(parquet_path, schema)
+    first_csv = True
+    jobs = jobs or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        window = 2 * jobs
+        chunks = iter_raw_chunks(inputs, chunksize)
+        sizes = deque()
+
+        def counted(chunks):
+            for chunk in chunks:
+                sizes.append(len(chunk))
+                yield chunk
+
+        for cleaned, reasons in _ordered_map(pool, clean_chunk, counted(chunks), window):
+            summary.update(cleaned, reasons, sizes.popleft())
+            writer.write_table(pa.Table.from_pandas(cleaned, schema=schema, preserve_index=False))
+            if csv_path:
+                cleaned.to_csv(csv_path, mode="w" if first_csv else "a", header=first_csv, index=False)
+                first_csv = False
+    writer.close()
+    if summary_path:
+        summary.write(summary_path)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Clean raw survey exports into columnar data and a summary workbook.")
+    parser.add_argument("inputs", nargs="+", type=Path)
+    parser.add_argument("-o", "--output", type=Path, default=DATA_DIR / "survey_data_cleaned.parquet")
+    parser.add_argument("--csv", type=Path, default=None, help="also write the cleaned rows as CSV")
+    parser.add_argument("--summary", type=Path, default=DATA_DIR / "survey_summary.xlsx")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    summary = run(args.inputs, args.output, args.csv, args.summary, args.chunksize, args.jobs)
+    rejected = summary.rows_read - summary.moments.n
+    print(f"{summary.rows_read:,} rows read, {summary.moments.n:,} kept, {rejected:,} rejected "
+          f"in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Cached loaders behind the survey dashboard."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from clean_survey import normalize_columns
+from survey_agg import FilterStage, SurveyEngine
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from common.online_stats import GroupedMoments
+from common import profiling
+from common.warmup import import_modules
+
+DATA_DIR = Path(__file__).resolve().parent
+PARQUET_FILE = DATA_DIR / "survey_data_cleaned.parquet"
+CSV_FILE = DATA_DIR / "survey_data_cleaned.csv"
+FILTER_COLUMNS = ["Gender", "preferred_platform", "Age"]
+
+
+# The parquet written by clean_survey.py if present, else the CSV
+def data_file():
+    return PARQUET_FILE if PARQUET_FILE.exists() else CSV_FILE
+
+
+# Load dataset
+@profiling.profiled("load data")
+@st.cache_data
+def load_data():
+    if data_file() == PARQUET_FILE:
+        return pd.read_parquet(PARQUET_FILE)
+    return normalize_columns(pd.read_csv(CSV_FILE))
+
+
+# Running moments per Gender x Age group for the correlation heatmap
+@profiling.profiled("build moments", rows=None)
+@st.cache_resource
+def load_moments(_df):
+    by = [col for col in ["Gender", "Age"] if col in _df.columns]
+    numerical_cols = _df.select_dtypes(include=['int64', 'float64']).columns
+    return GroupedMoments.from_frame(_df, by, numerical_cols)
+
+
+# Integer-coded answers; charts draw from counts rather than raw responses
+@profiling.profiled("encode answers", rows=None)
+@st.cache_resource
+def load_engine(_df):
+    return SurveyEngine(_df)
+
+
+# Filter and chart columns packed into one key per response
+@profiling.profiled("pack filter keys", rows=None)
+@st.cache_resource
+def load_filter_stage(_engine, columns):
+    return FilterStage(_engine, columns)
+
+
+def filter_columns(df):
+    return tuple(col for col in FILTER_COLUMNS if col in df.columns)
+
+
+def warm(step):
+    with step("load data"):
+        df = load_data()
+    with step("build moments"):
+        load_moments(df)
+    with step("encode answers"):
+        engine = load_engine(df)
+    with step("pack filter keys"):
+        load_filter_stage(engine, filter_columns(df))
+    import_modules(step, "matplotlib.pyplot", "seaborn")
@@ -0,0 +1,270 @@
+"""Headless benchmarks of every dashboard on synthetic data of growing size.
+
+Usage:
+    python benchmarks/bench_apps.py [--apps student covid ...] [--sizes 10000 100000 ...]
+        [--reruns 3] [--timeout 900] [-o results.json] [--compare BASELINE.json]
+
+For every app and size, the project is copied into a scratch directory next
+to a copy of `common/`, its dataset is replaced by a synthetic one with the
+same schema (see synthetic.py), and the script is run with Streamlit's
+AppTest in a fresh process. Each run records the cold-start time (first
+script run, caches empty), the median rerun time after a sidebar filter
+change, and the process's peak RSS. Results are written as JSON, by default
+to benchmarks/results/apps-<commit>.json, so runs on two commits can be
+diffed with --compare.
+"""
+
+import argparse
+import json
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+import synthetic
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+
+# Student uploads go through st.file_uploader, which AppTest cannot drive, so
+# the app runs under this entry script with the uploader patched.
+UPLOAD_ENTRY = '''\
+import io
+import runpy
+import sys
+from pathlib import Path
+
+import streamlit as st
+
+here = Path(__file__).resolve().parent
+sys.path.insert(0, str(here))
+
+
+class Upload(io.BytesIO):
+    name = {data_file!r}
+
+
+raw = (here / {data_file!r}).read_bytes()
+st.file_uploader = lambda *args, key=None, **kwargs: None if key else Upload(raw)
+runpy.run_path(str(here / {script!r}), run_name="__main__")
+'''
+
+
+# ====================== INTERACTIONS ======================
+def _widget(widgets, label):
+    return next(w for w in widgets if w.label == label)
+
+
+def toggle_multiselect(label):
+    """Alternate a multiselect between its first option and all options."""
+    def interact(at, step):
+        widget = _widget(at.multiselect, label)
+        widget.set_value(widget.options[:1] if step % 2 == 0 else widget.options)
+    return interact
+
+
+def toggle_slider(label, values):
+    def interact(at, step):
+        _widget(at.slider, label).set_value(values[step % len(values)])
+    return interact
+
+
+def toggle_survey_age(at, step):
+    slider = _widget(at.slider, "Select Age Range:")
+    low, high = slider.min, slider.max
+    slider.set_value((low + 5, high - 5) if step % 2 == 0 else (low, high))
+
+
+def preload_traffic(at, data_path):
+    import pandas as pd
+
+    # app2.py simulates its data unless the session already holds a frame
+    at.session_state["traffic_df"] = pd.read_parquet(data_path)
+    at.session_state["base_lat"] = 20.2961
+    at.session_state["base_lon"] = 85.8245
+    at.session_state["city_search"] = "Bhubaneswar"
+    at.session_state["last_updated"] = datetime.now()
+
+
+# ====================== APPS ======================
+class App(NamedTuple):
+    name: str
+    project: str
+    script: str
+    data_file: str
+    generate: Callable
+    interact: Callable
+    upload: bool = False
+    setup: Optional[Callable] = None
+
+
+APPS = [
+    App("student", "Project_2_Student_Performance_Analysis", "app.py", "student_performance_100.xlsx",
+        synthetic.students, toggle_multiselect("Select Gender"), upload=True),
+    App("covid", "Project_4_COVID_Data_Analysis", "app.py", "country_wise_latest.csv",
+        synthetic.country_wise_latest, toggle_slider("Countries", [20, 10])),
+    App("ecommerce", "Project_5_E-Commerce Data Insights", "app.py", "Sample - Superstore.csv",
+        synthetic.superstore, toggle_multiselect("Select Customer Segments")),
+    App("netflix", "Project_6_Netflix_user_behaviour", "app.py", "Dim_User.xlsx",
+        synthetic.netflix_users, toggle_multiselect("Select Genders")),
+    App("traffic", "Project_7_Traffic_Pattern_Analysis", "app2.py", "traffic.parquet",
+        synthetic.traffic, toggle_slider("Congestion threshold (km/h)", [15, 20]), setup=preload_traffic),
+    App("survey", "Project_8_Survey_Visualization", "app.py", "survey_data_cleaned.csv",
+        synthetic.survey, toggle_survey_age),
+]
+APPS_BY_NAME = {app.name: app for app in APPS}
+
+
+# ====================== WORKER ======================
+def prepare(app, rows, workdir):
+    """Copy the project and common/ into `workdir` with a synthetic dataset."""
+    project = workdir / app.project
+    shutil.copytree(ROOT / app.project, project,
+                    ignore=shutil.ignore_patterns("*.pbix", "*.ipynb", "__pycache__", "covid_store"))
+    shutil.copytree(ROOT / "common", workdir / "common", ignore=shutil.ignore_patterns("__pycache__"))
+    # A stale cleaned parquet would shadow the synthetic survey CSV
+    (project / "survey_data_cleaned.parquet").unlink(missing_ok=True)
+
+    df = app.generate(rows)
+    if app.data_file.endswith(".parquet"):
+        df.to_parquet(project / app.data_file, index=False)
+    else:
+        synthetic.write(df, project / app.data_file)
+    if app.upload:
+        (project / "_bench_entry.py").write_text(UPLOAD_ENTRY.format(data_file=app.data_file, script=app.script))
+    return project
+
+
+def run_app(app, project, reruns, timeout):
+    """Cold start, reruns and peak RSS of one app; runs inside the worker process."""
+    import os
+
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(project)
+    at = AppTest.from_file(str(project / ("_bench_entry.py" if app.upload else app.script)),
+                           default_timeout=timeout)
+    if app.setup:
+        app.setup(at, project / app.data_file)
+
+    start = time.perf_counter()
+    at.run()
+    cold = time.perf_counter() - start
+    if at.exception:
+        return {"status": "error", "error": at.exception[0].message}
+
+    samples = []
+    for step in range(reruns):
+        app.interact(at, step)
+        start = time.perf_counter()
+        at.run()
+        samples.append(time.perf_counter() - start)
+        if at.exception:
+            return {"status": "error", "error": at.exception[0].message}
+
+    return {
+        "status": "ok",
+        "cold_start_s": round(cold, 4),
+        "rerun_s": round(statistics.median(samples), 4),
+        "rerun_samples_s": [round(s, 4) for s in samples],
+        # ru_maxrss is in KiB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def bench(app, rows, reruns, timeout):
+    """Prepare data in this process, then measure the app in a fresh one."""
+    result = {"app": app.name, "rows": rows}
+    if app.data_file.endswith(".xlsx") and rows > synthetic.XLSX_MAX_ROWS:
+        return {**result, "status": "skipped", "error": "exceeds the xlsx sheet row limit"}
+
+    with tempfile.TemporaryDirectory(prefix=f"bench_{app.name}_") as tmp:
+        start = time.perf_counter()
+        project = prepare(app, rows, Path(tmp))
+        result["generate_s"] = round(time.perf_counter() - start, 2)
+        cmd = [sys.executable, __file__, "--worker", app.name, str(project),
+               "--reruns", str(reruns), "--timeout", str(timeout)]
+        try:
+            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout * (reruns + 1))
+        except subprocess.TimeoutExpired:
+            return {**result, "status": "timeout"}
+    if proc.returncode != 0 or not proc.stdout.strip():
+        return {**result, "status": "error", "error": proc.stderr.strip().splitlines()[-1:] or ["no output"]}
+    return {**result, **json.loads(proc.stdout.strip().splitlines()[-1])}
+
+
+# ====================== REPORTING ======================
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_row(result, baseline=None):
+    line = f"{result['app']:10} {result['rows']:>12,}  "
+    if result["status"] != "ok":
+        print(line + f"{result['status']}: {result.get('error', '')}")
+        return
+    line += f"cold {result['cold_start_s']:8.3f}s  rerun {result['rerun_s']:8.3f}s  peak {result['peak_rss_mb']:8.1f} MB"
+    if baseline and baseline.get("status") == "ok":
+        deltas = [f"{key.split('_')[0]} {result[key] / baseline[key]:.2f}x"
+                  for key in ("cold_start_s", "rerun_s", "peak_rss_mb") if baseline[key]]
+        line += "  (vs baseline: " + ", ".join(deltas) + ")"
+    print(line, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dashboards headlessly on synthetic data.")
+    parser.add_argument("--apps", nargs="+", choices=list(APPS_BY_NAME), default=list(APPS_BY_NAME))
+    parser.add_argument("--sizes", nargs="+", type=lambda s: int(float(s)), default=DEFAULT_SIZES)
+    parser.add_argument("--reruns", type=int, default=3)
+    parser.add_argument("--timeout", type=int, default=900, help="seconds allowed per script run")
+    parser.add_argument("-o", "--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None, help="earlier results file to compare against")
+    parser.add_argument("--worker", nargs=2, metavar=("APP", "PROJECT_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        name, project = args.worker
+        print(json.dumps(run_app(APPS_BY_NAME[name], Path(project), args.reruns, args.timeout)))
+        return 0
+
+    baseline = {}
+    if args.compare:
+        for result in json.loads(args.compare.read_text())["results"]:
+            baseline[result["app"], result["rows"]] = result
+
+    commit = git_commit()
+    results = []
+    for app in (APPS_BY_NAME[name] for name in args.apps):
+        for rows in args.sizes:
+            result = bench(app, rows, args.reruns, args.timeout)
+            results.append(result)
+            print_row(result, baseline.get((app.name, rows)))
+
+    output = args.output or RESULTS_DIR / f"apps-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "commit": commit,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "reruns": args.reruns,
+        "results": results,
+    }, indent=2))
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Training time and batch-inference throughput of the student score model.
+
+Usage:
+    python benchmarks/bench_student_model.py [--rows 1000000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "Project_2_Student_Performance_Analysis"))
+from student_model import ScoreModel
+from synthetic import students
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    df = students(args.rows)
+
+    fit_times = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        model = ScoreModel.fit(df)
+        fit_times.append(time.perf_counter() - start)
+
+    predict_times = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        model.predict(df)
+        predict_times.append(time.perf_counter() - start)
+
+    what_if = df.head(1)
+    start = time.perf_counter()
+    for _ in range(100):
+        model.predict(what_if)
+    single = (time.perf_counter() - start) / 100
+
+    print(f"rows:               {args.rows:,}")
+    print(f"training:           {min(fit_times):.3f} s (best of {args.repeat})")
+    print(f"batch inference:    {min(predict_times):.3f} s, {args.rows / min(predict_times):,.0f} rows/s")
+    print(f"single prediction:  {single * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Startup import cost of each dashboard, checked against a budget.
+
+Usage:
+    python benchmarks/check_import_time.py [--apps student covid ...] [--repeat 5]
+        [--budget benchmarks/import_budget.json] [--update]
+
+Each app's top-level import statements are run in a fresh interpreter under
+`python -X importtime`, from the project directory (on sys.path, as under
+`streamlit run`).
+The cost is the summed cumulative time of the modules imported at top level,
+minus a bare interpreter's, best of --repeat runs. The check fails if an app
+exceeds its budget in import_budget.json; --update rewrites the budgets as
+the current measurements plus headroom.
+"""
+
+import argparse
+import ast
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from bench_apps import APPS, ROOT
+
+BUDGET_FILE = Path(__file__).resolve().parent / "import_budget.json"
+HEADROOM = 1.25
+
+
+def startup_code(script):
+    """The script's top-level imports, as a runnable snippet."""
+    source = script.read_text(encoding="utf-8")
+    lines = [f"__file__ = {str(script)!r}"]
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            lines.append(ast.get_source_segment(source, node))
+    return "\n".join(lines)
+
+
+def top_level_imports(code, cwd):
+    """{module: cumulative microseconds} for modules imported directly by `code`."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=cwd,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented two spaces per level
+        if len(name) - len(name.lstrip()) == 1:
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def measure(app, repeat):
+    script = ROOT / app.project / app.script
+    code = startup_code(script)
+    best = None
+    for _ in range(repeat):
+        modules = top_level_imports(code, ROOT / app.project)
+        baseline = top_level_imports("pass", ROOT / app.project)
+        total = sum(modules.values()) - sum(baseline.values())
+        if best is None or total < best[0]:
+            extra = {name: us for name, us in modules.items() if name not in baseline}
+            best = (total, extra)
+    total, modules = best
+    heaviest = sorted(modules.items(), key=lambda item: -item[1])[:5]
+    return total / 1000, [(name, us / 1000) for name, us in heaviest]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the dashboards' import time against a budget.")
+    parser.add_argument("--apps", nargs="+", choices=[app.name for app in APPS], default=[app.name for app in APPS])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=Path, default=BUDGET_FILE)
+    parser.add_argument("--update", action="store_true", help="write current times plus headroom as the budget")
+    args = parser.parse_args(argv)
+
+    budget = json.loads(args.budget.read_text()) if args.budget.exists() else {}
+    failed = 0
+    for app in (app for app in APPS if app.name in args.apps):
+        try:
+            elapsed, heaviest = measure(app, args.repeat)
+        except RuntimeError as e:
+            failed += 1
+            print(f"{app.name:10} ERROR  {e}")
+            continue
+        limit = budget.get(app.name)
+        if args.update:
+            budget[app.name] = round(elapsed * HEADROOM)
+            status = "budget set"
+        elif limit is None:
+            status = "no budget"
+        elif elapsed > limit:
+            failed += 1
+            status = f"OVER budget of {limit} ms"
+        else:
+            status = f"ok (budget {limit} ms)"
+        print(f"{app.name:10} {elapsed:8.1f} ms  {status}")
+        print("           " + ", ".join(f"{name} {ms:.0f} ms" for name, ms in heaviest))
+
+    if args.update:
+        args.budget.write_text(json.dumps(dict(sorted(budget.items())), indent=2) + "\n")
+        print(f"Budget written to {args.budget}")
+        return 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""Scalable synthetic datasets matching the schema of each project's data.
+
+Every generator takes a row count and a seed and returns a DataFrame with the
+same columns, dtypes and value domains as the file the dashboard reads, so
+the apps can be exercised at sizes far beyond the bundled samples.
+"""
+
+import numpy as np
+import pandas as pd
+
+# xlsx sheets hold at most 1,048,576 rows including the header
+XLSX_MAX_ROWS = 1_048_575
+
+
+def _choice(rng, labels, rows, p=None):
+    return pd.Categorical.from_codes(rng.choice(len(labels), rows, p=p), labels)
+
+
+def superstore(rows, seed=0):
+    """Sample - Superstore.csv"""
+    rng = np.random.default_rng(seed)
+    sub_categories = {
+        "Furniture": ["Bookcases", "Chairs", "Tables", "Furnishings"],
+        "Office Supplies": ["Labels", "Storage", "Art", "Binders", "Appliances",
+                            "Paper", "Envelopes", "Fasteners", "Supplies"],
+        "Technology": ["Phones", "Accessories", "Machines", "Copiers"],
+    }
+    pairs = [(cat, sub) for cat, subs in sub_categories.items() for sub in subs]
+    states = [f"State {i:02d}" for i in range(49)]
+    regions = ["South", "West", "Central", "East"]
+
+    order_dates = pd.Timestamp("2014-01-03") + pd.to_timedelta(rng.integers(0, 1458, rows), unit="D")
+    ship_dates = order_dates + pd.to_timedelta(rng.integers(0, 8, rows), unit="D")
+    product = rng.integers(0, 1862, rows)
+    pair = rng.integers(0, len(pairs), rows)
+    state = rng.integers(0, len(states), rows)
+    customer = rng.integers(0, 793, rows)
+    quantity = rng.integers(1, 15, rows)
+    discount = rng.choice([0, 0, 0, 0.1, 0.2, 0.3, 0.5, 0.8], rows)
+    sales = np.round(rng.lognormal(4, 1.3, rows), 2)
+    return pd.DataFrame({
+        "Row ID": np.arange(1, rows + 1),
+        "Order ID": [f"CA-{y}-{n:06d}" for y, n in zip(order_dates.year, rng.integers(0, 10**6, rows))],
+        "Order Date": order_dates.strftime("%-m/%-d/%Y"),
+        "Ship Date": ship_dates.strftime("%-m/%-d/%Y"),
+        "Ship Mode": _choice(rng, ["Second Class", "Standard Class", "First Class", "Same Day"], rows,
+                             p=[0.2, 0.6, 0.15, 0.05]),
+        "Customer ID": pd.Categorical.from_codes(customer, [f"CU-{i:05d}" for i in range(793)]),
+        "Customer Name": pd.Categorical.from_codes(customer, [f"Customer {i}" for i in range(793)]),
+        "Segment": _choice(rng, ["Consumer", "Corporate", "Home Office"], rows, p=[0.52, 0.3, 0.18]),
+        "Country": "United States",
+        "City": pd.Categorical.from_codes(rng.integers(0, 531, rows), [f"City {i}" for i in range(531)]),
+        "State": pd.Categorical.from_codes(state, states),
+        "Postal Code": 10000 + rng.integers(0, 89999, rows),
+        "Region": pd.Categorical.from_codes(state % len(regions), regions),
+        "Product ID": pd.Categorical.from_codes(product, [f"PR-{i:08d}" for i in range(1862)]),
+        "Category": pd.Categorical([pairs[i][0] for i in range(len(pairs))])[pair],
+        "Sub-Category": pd.Categorical([pairs[i][1] for i in range(len(pairs))])[pair],
+        "Product Name": pd.Categorical.from_codes(product, [f"Product {i}" for i in range(1862)]),
+        "Sales": sales,
+        "Quantity": quantity,
+        "Discount": discount,
+        "Profit": np.round(sales * (0.25 - discount) * rng.uniform(0.2, 1.2, rows), 4),
+    })
+
+
+def netflix_users(rows, seed=0):
+    """Dim_User.xlsx"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "User ID": np.arange(1, rows + 1),
+        "Gender": _choice(rng, ["Male", "Female"], rows),
+        "Device": _choice(rng, ["Smartphone", "Tablet", "Smart TV", "Laptop"], rows),
+        "Country": _choice(rng, ["United States", "Canada", "United Kingdom", "Australia", "Germany",
+                                 "France", "Brazil", "Mexico", "Spain", "Italy"], rows),
+        "FamilyMember": rng.integers(1, 7, rows),
+        "Age": rng.integers(12, 70, rows),
+        "TimeConsumingPerWeek": rng.integers(1, 11, rows),
+        "Genre": _choice(rng, ["Horror", "Comedy", "Action & Adventure", "Dramma", "Others"], rows),
+        "Satisfaction": _choice(rng, ["Satisfied", "Extremely satisfied", "Neutral", "Dissatisfied",
+                                      "Extremely dissatisfied"], rows),
+        "MontlyIncomeUSD": rng.integers(5, 43, rows) * 100,
+    })
+
+
+def country_wise_latest(rows, seed=0):
+    """country_wise_latest.csv, one synthetic country per row"""
+    rng = np.random.default_rng(seed)
+    confirmed = rng.lognormal(9, 2.5, rows).astype(np.int64) + 10
+    deaths = (confirmed * rng.uniform(0, 0.1, rows)).astype(np.int64)
+    recovered = ((confirmed - deaths) * rng.uniform(0, 1, rows)).astype(np.int64)
+    new_cases = (confirmed * rng.uniform(0, 0.02, rows)).astype(np.int64)
+    last_week = confirmed - (confirmed * rng.uniform(0, 0.2, rows)).astype(np.int64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        df = pd.DataFrame({
+            "Country/Region": [f"Country {i:08d}" for i in range(rows)],
+            "Confirmed": confirmed,
+            "Deaths": deaths,
+            "Recovered": recovered,
+            "Active": confirmed - deaths - recovered,
+            "New cases": new_cases,
+            "New deaths": (new_cases * rng.uniform(0, 0.05, rows)).astype(np.int64),
+            "New recovered": (new_cases * rng.uniform(0, 1, rows)).astype(np.int64),
+            "Deaths / 100 Cases": np.round(deaths / confirmed * 100, 2),
+            "Recovered / 100 Cases": np.round(recovered / confirmed * 100, 2),
+            "Deaths / 100 Recovered": np.round(np.where(deaths == 0, 0, deaths / recovered * 100), 2),
+            "Confirmed last week": last_week,
+            "1 week change": confirmed - last_week,
+            "1 week % increase": np.round((confirmed - last_week) / last_week * 100, 2),
+        })
+    df["WHO Region"] = _choice(rng, ["Eastern Mediterranean", "Europe", "Africa", "Americas",
+                                     "Western Pacific", "South-East Asia"], rows)
+    return df
+
+
+def students(rows, seed=0):
+    """student_performance_100.xlsx (categorical columns, uint8 scores)"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "Student ID": np.arange(rows),
+        "Gender": pd.Categorical.from_codes(rng.integers(0, 2, rows), ["Female", "Male"]),
+        "Ethnicity": pd.Categorical.from_codes(rng.integers(0, 5, rows), [f"Group {g}" for g in "ABCDE"]),
+        "Parental Education": pd.Categorical.from_codes(
+            rng.integers(0, 6, rows),
+            ["Some High School", "High School", "Some College", "Associate's Degree",
+             "Bachelor's Degree", "Master's Degree"]),
+        "Test Preparation": pd.Categorical.from_codes(rng.integers(-1, 1, rows), ["Completed"]),
+    })
+    base = 55 + 4 * df["Gender"].cat.codes + 2 * df["Ethnicity"].cat.codes + 6 * (df["Test Preparation"].cat.codes + 1)
+    for col in ["Math Score", "Reading Score", "Writing Score"]:
+        df[col] = np.clip(base + rng.normal(0, 12, rows), 0, 100).round().astype(np.uint8)
+    return df
+
+
+def survey(rows, seed=0):
+    """survey_data_cleaned.csv"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Age": rng.integers(18, 65, rows),
+        "Gender": _choice(rng, ["Female", "Other", "Male"], rows),
+        "Satisfaction": rng.integers(1, 6, rows),
+        "Device": _choice(rng, ["Tablet", "Mobile", "Desktop"], rows),
+        "Response_Time": rng.integers(2, 60, rows),
+    })
+
+
+def traffic(rows, seed=0, base_lat=20.2961, base_lon=85.8245, days_history=7):
+    """The frame app2.py simulates (timestamp, position, speed, vehicle type)"""
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp.now()
+    timestamps = pd.date_range(end - pd.Timedelta(days=days_history), end, periods=rows)
+    speed = rng.uniform(5, 60, rows)
+    rush = ((timestamps.hour >= 7) & (timestamps.hour <= 11)) | ((timestamps.hour >= 16) & (timestamps.hour <= 21))
+    speed[rush] *= rng.uniform(0.2, 0.4)
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "latitude": base_lat + rng.normal(0, 0.02, rows),
+        "longitude": base_lon + rng.normal(0, 0.02, rows),
+        "speed": speed,
+        "vehicle_type": rng.choice(["car", "motorcycle", "truck", "bus", "auto"], rows,
+                                   p=[0.5, 0.3, 0.1, 0.05, 0.05]),
+    })
+
+
+def write(df, path):
+    """Write `df` in the format implied by the file name."""
+    path = str(path)
+    if path.endswith(".xlsx"):
+        if len(df) > XLSX_MAX_ROWS:
+            raise ValueError(f"{len(df):,} rows exceed the xlsx sheet limit of {XLSX_MAX_ROWS:,}")
+        df.to_excel(path, index=False)
+    else:
+        df.to_csv(path, index=False)
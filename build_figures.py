@@ -0,0 +1,160 @@
+"""Incremental, parallel build of the static figures committed with the projects.
+
+Usage:
+    python build_figures.py [NAME ...] [--force] [--jobs N] [--list]
+
+Every artifact is declared below with its input datasets and the function
+that renders it. An artifact is rebuilt only when its output is missing or
+the fingerprint of its inputs and renderer source differs from the one in
+.figures_manifest.json; stale artifacts render in parallel in a process pool.
+
+The manifest is committed with the figures, so a fresh clone finds them up
+to date. Project_7's hotspots.html is not declared: it came from a simulated
+dataset that is not in the repo, and no renderer here reproduces it.
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+ROOT = Path(__file__).resolve().parent
+MANIFEST = ROOT / ".figures_manifest.json"
+
+
+# ====================== RENDERERS ======================
+def render_covid_top10(inputs, output):
+    import pandas as pd
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    df = pd.read_csv(inputs[0])
+    top10 = df.nlargest(10, "Confirmed")
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    sns.barplot(x="Confirmed", y="Country/Region", data=top10, palette="Reds_r", ax=ax)
+    ax.set_title("Top 10 Confirmed Cases")
+    ax.set_ylabel("")
+    fig.savefig(output)
+
+
+def render_age_distribution(inputs, output):
+    import pandas as pd
+    from matplotlib.figure import Figure
+
+    df = pd.read_csv(inputs[0])
+    fig = Figure()
+    ax = fig.subplots()
+    ax.hist(df["Age"].dropna(), bins=10, edgecolor="black")
+    ax.set_title("Age Distribution")
+    fig.savefig(output, dpi=300)
+
+
+# ====================== ARTIFACTS ======================
+class Artifact(NamedTuple):
+    name: str
+    output: str
+    inputs: list
+    render: Callable
+
+
+ARTIFACTS = [
+    Artifact("covid_top10", "Project_4_COVID_Data_Analysis/top10_confirmed_bar.png",
+             ["Project_4_COVID_Data_Analysis/country_wise_latest.csv"], render_covid_top10),
+    Artifact("survey_age_distribution", "Project_8_Survey_Visualization/age_distribution.png",
+             ["Project_8_Survey_Visualization/survey_data_cleaned.csv"], render_age_distribution),
+]
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fingerprint(artifact):
+    """Hash of the artifact's input contents and its renderer's source."""
+    digest = hashlib.sha256(inspect.getsource(artifact.render).encode())
+    for path in artifact.inputs:
+        digest.update(path.encode())
+        digest.update(_file_digest(ROOT / path).encode())
+    return digest.hexdigest()
+
+
+def _render(name, inputs, output):
+    artifact = next(a for a in ARTIFACTS if a.name == name)
+    start = time.perf_counter()
+    tmp = output.with_name(output.stem + ".tmp" + output.suffix)
+    artifact.render(inputs, tmp)
+    os.replace(tmp, output)
+    return time.perf_counter() - start
+
+
+def build(names=None, force=False, jobs=None):
+    # Entries of artifacts not rebuilt here are kept, --force or not
+    manifest = json.loads(MANIFEST.read_text()) if MANIFEST.exists() else {}
+    selected = [a for a in ARTIFACTS if not names or a.name in names]
+
+    stale = {}
+    for artifact in selected:
+        digest = fingerprint(artifact)
+        if not force and manifest.get(artifact.name) == digest and (ROOT / artifact.output).exists():
+            print(f"  up to date  {artifact.name}")
+        else:
+            stale[artifact.name] = digest
+
+    failed = 0
+    if stale:
+        with ProcessPoolExecutor(max_workers=jobs or min(len(stale), os.cpu_count())) as pool:
+            futures = {
+                pool.submit(_render, artifact.name, [ROOT / p for p in artifact.inputs], ROOT / artifact.output): artifact
+                for artifact in selected if artifact.name in stale
+            }
+            for future in as_completed(futures):
+                artifact = futures[future]
+                try:
+                    elapsed = future.result()
+                except Exception as e:
+                    failed += 1
+                    manifest.pop(artifact.name, None)
+                    print(f"  FAILED      {artifact.name}: {e}", file=sys.stderr)
+                    continue
+                manifest[artifact.name] = stale[artifact.name]
+                print(f"  built       {artifact.name} ({elapsed:.2f}s) -> {artifact.output}")
+
+    MANIFEST.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild the projects' static figures.")
+    parser.add_argument("names", nargs="*", help="artifacts to build (default: all)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if inputs are unchanged")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--list", action="store_true", help="list declared artifacts and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for artifact in ARTIFACTS:
+            print(f"{artifact.name:28} {artifact.output}  <- {', '.join(artifact.inputs)}")
+        return 0
+    unknown = set(args.names) - {a.name for a in ARTIFACTS}
+    if unknown:
+        parser.error(f"unknown artifact(s): {', '.join(sorted(unknown))}")
+
+    start = time.perf_counter()
+    failed = build(args.names, args.force, args.jobs)
+    print(f"Done in {time.perf_counter() - start:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""Concurrent building of a rerun's independent charts.
+
+    charts = ChartScheduler()
+    charts.add(col1, "monthly sales", build_monthly_sales, filtered_data)
+    charts.add(col2, "sales by category", build_category_pie, filtered_data)
+    charts.render()
+
+`add` reserves a placeholder in the given container (st, a column, a tab)
+and submits the builder to a thread pool shared by all sessions; `render`
+waits for the results in the order the charts were added and shows each in
+its placeholder. Rerun time for a set of charts then approaches that of the
+slowest rather than their sum.
+
+Builders run off the script thread, so they must not call Streamlit. They
+return a Plotly figure, or a matplotlib Figure from `subplots()` below:
+object-oriented and rendered with Agg, no pyplot state shared between
+threads. Matplotlib figures are rasterized in the worker too, with the same
+savefig options as st.pyplot.
+"""
+
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from common import profiling
+
+_lock = threading.Lock()
+_pool = None
+
+# st.pyplot's defaults, so pre-rendered figures look the same
+SAVEFIG_OPTIONS = {"format": "png", "dpi": 200, "bbox_inches": "tight"}
+
+
+def _executor():
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="charts")
+        return _pool
+
+
+def subplots(nrows=1, ncols=1, **fig_kw):
+    """A matplotlib Figure and its axes, like plt.subplots but without pyplot."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(**fig_kw)
+    return fig, fig.subplots(nrows, ncols)
+
+
+def _build(name, run, build, args, kwargs):
+    with profiling.stage(f"chart: {name}", run=run):
+        fig = build(*args, **kwargs)
+        if hasattr(fig, "savefig"):
+            image = io.BytesIO()
+            fig.savefig(image, **SAVEFIG_OPTIONS)
+            return image.getvalue()
+        return fig
+
+
+class ChartScheduler:
+    """Builds charts in the shared pool and places them in their slots in order."""
+
+    def __init__(self):
+        self._jobs = []
+
+    def add(self, slot, name, build, *args, **kwargs):
+        """Reserve a place in `slot` and start `build(*args, **kwargs)` in the pool."""
+        placeholder = slot.empty()
+        future = _executor().submit(_build, name, profiling.current_run(), build, args, kwargs)
+        self._jobs.append((placeholder, future))
+        return future
+
+    def render(self):
+        """Show every added chart, waiting for each in turn; builder errors are raised here."""
+        jobs, self._jobs = self._jobs, []
+        for placeholder, future in jobs:
+            result = future.result()
+            if isinstance(result, bytes):
+                placeholder.image(result, width="stretch")
+            else:
+                placeholder.plotly_chart(result, width="stretch")
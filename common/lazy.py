@@ -0,0 +1,73 @@
+"""Deferred imports for heavy plotting and modelling libraries.
+
+`lazy_import("seaborn")` returns a module proxy that imports seaborn on the
+first attribute access, so a dashboard can paint its header and metric cards
+before paying for matplotlib, plotly, sklearn or Prophet. `preload(...)`
+imports the given proxies in a background thread once the first run has
+rendered, so the first chart usually finds them already loaded.
+"""
+
+import importlib
+import sys
+import threading
+import types
+
+_lock = threading.RLock()
+_preloading = set()
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            # The import system's per-module locks make concurrent first loads safe
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def loaded(self):
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name):
+    """A proxy for module `name`; the real module if it is already imported."""
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+
+def preload(*modules):
+    """Import lazy `modules` in a daemon thread; each is started at most once per process."""
+    with _lock:
+        pending = [m for m in modules if isinstance(m, LazyModule) and not m.loaded and m.__name__ not in _preloading]
+        _preloading.update(m.__name__ for m in pending)
+    if not pending:
+        return None
+
+    def run():
+        for module in pending:
+            try:
+                module._load()
+            except ImportError:
+                # Surfaces again, with a traceback, where the app actually uses it
+                pass
+
+    thread = threading.Thread(target=run, name="lazy-preload", daemon=True)
+    thread.start()
+    return thread
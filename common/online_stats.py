@@ -0,0 +1,184 @@
+"""Mergeable running statistics for filtered summaries and correlations.
+
+`Moments` keeps count, mean, co-moment matrix, min and max for a set of
+numeric columns (Welford / Chan et al. updates), so two accumulators merge
+exactly. `GroupedMoments` keeps one accumulator per categorical group; any
+filter combination's describe() or corr() is then a merge over groups
+rather than a pass over rows.
+"""
+
+import numpy as np
+import pandas as pd
+
+QUANTILES = (0.25, 0.5, 0.75)
+
+
+class Moments:
+    """Running moments of several numeric columns.
+
+    `grids` optionally maps a column to a (start, width, bins) histogram so
+    describe() can report quartiles; they are exact for data on that grid
+    (e.g. integer scores with width 1). A column that receives values off
+    its grid (fractions, out of range) is listed in `off_grid` and its
+    quartiles are NaN rather than approximated.
+    """
+
+    def __init__(self, columns, grids=None):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.n = 0
+        self.mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))
+        self.min = np.full(k, np.inf)
+        self.max = np.full(k, -np.inf)
+        self.grids = dict(grids or {})
+        self.hists = {col: np.zeros(bins, dtype=np.int64) for col, (_, _, bins) in self.grids.items()}
+        self.off_grid = set()
+
+    @classmethod
+    def from_array(cls, columns, values, grids=None):
+        moments = cls(columns, grids)
+        moments.update(values)
+        return moments
+
+    def copy(self):
+        other = Moments(self.columns, self.grids)
+        other.merge(self)
+        return other
+
+    def update(self, values):
+        """Add rows (a 2-D array in column order); rows with NaN are skipped."""
+        values = np.asarray(values, dtype=float).reshape(-1, len(self.columns))
+        values = values[~np.isnan(values).any(axis=1)]
+        if len(values) == 0:
+            return self
+        batch = Moments(self.columns)
+        batch.n = len(values)
+        batch.mean = values.mean(axis=0)
+        centered = values - batch.mean
+        batch.comoment = centered.T @ centered
+        batch.min = values.min(axis=0)
+        batch.max = values.max(axis=0)
+        for col, (start, width, bins) in self.grids.items():
+            position = (values[:, self.columns.index(col)] - start) / width
+            index = np.rint(position).astype(np.int64)
+            if not (np.allclose(position, index, rtol=0, atol=1e-6) and index.min() >= 0 and index.max() < bins):
+                self.off_grid.add(col)
+            self.hists[col] += np.bincount(np.clip(index, 0, bins - 1), minlength=bins)
+        return self._merge_moments(batch)
+
+    def merge(self, other):
+        for col, hist in other.hists.items():
+            if col in self.hists:
+                self.hists[col] += hist
+        self.off_grid |= other.off_grid & set(self.hists)
+        return self._merge_moments(other)
+
+    def _merge_moments(self, other):
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.comoment = self.comoment + other.comoment + np.outer(delta, delta) * (self.n * other.n / n)
+        self.mean = self.mean + delta * (other.n / n)
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self.n = n
+        return self
+
+    def covariance(self):
+        if self.n < 2:
+            return np.full_like(self.comoment, np.nan)
+        return self.comoment / (self.n - 1)
+
+    def std(self):
+        return np.sqrt(np.diag(self.covariance()))
+
+    def corr(self):
+        cov = self.covariance()
+        scale = np.sqrt(np.diag(cov))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.outer(scale, scale)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def quantile(self, column, q):
+        """Linear-interpolated quantile from the column's histogram; NaN when it would not be exact."""
+        if column not in self.hists or column in self.off_grid or self.n == 0:
+            return np.nan
+        start, width, _ = self.grids[column]
+        cumulative = np.cumsum(self.hists[column])
+        position = q * (cumulative[-1] - 1)
+        lower = int(np.floor(position))
+        ranks = np.searchsorted(cumulative, [lower, min(lower + 1, cumulative[-1] - 1)], side="right")
+        low, high = start + ranks * width
+        return low + (high - low) * (position - lower)
+
+    def describe(self):
+        """Same layout as DataFrame.describe() for the tracked columns."""
+        empty = self.n == 0
+        rows = {
+            "count": np.full(len(self.columns), float(self.n)),
+            "mean": np.full(len(self.columns), np.nan) if empty else self.mean,
+            "std": self.std(),
+            "min": np.full(len(self.columns), np.nan) if empty else self.min,
+        }
+        for q in QUANTILES:
+            rows[f"{q:.0%}"] = [self.quantile(col, q) for col in self.columns]
+        rows["max"] = np.full(len(self.columns), np.nan) if empty else self.max
+        return pd.DataFrame(rows, index=self.columns).T
+
+
+def _selected(value, allowed):
+    if pd.isna(value):
+        return any(pd.isna(v) for v in allowed)
+    return value in allowed
+
+
+class GroupedMoments:
+    """One `Moments` per combination of the `by` columns."""
+
+    def __init__(self, by, columns, grids=None):
+        self.by = list(by)
+        self.columns = list(columns)
+        self.grids = grids
+        self.groups = {}
+
+    @classmethod
+    def from_frame(cls, df, by, columns, grids=None):
+        grouped = cls(by, columns, grids)
+        grouped.update(df)
+        return grouped
+
+    def update(self, df):
+        """Fold new rows into their groups."""
+        values = df[self.columns].to_numpy(dtype=float)
+        indices = df.groupby(self.by, observed=True, dropna=False, sort=False).indices
+        for key, index in indices.items():
+            key = key if isinstance(key, tuple) else (key,)
+            group = self.groups.get(key)
+            if group is None:
+                group = self.groups[key] = Moments(self.columns, self.grids)
+            group.update(values[index])
+        return self
+
+    def combine(self, selection=None, by=None):
+        """Merge the groups whose keys fall in `selection` ({column: allowed values}).
+
+        With `by`, returns {value of that column: Moments} instead of one total;
+        rows missing that column are left out, as in DataFrame.groupby.
+        """
+        selection = {col: list(values) for col, values in (selection or {}).items()}
+        positions = {col: self.by.index(col) for col in selection}
+        result = {}
+        for key, group in self.groups.items():
+            if not all(_selected(key[positions[col]], allowed) for col, allowed in selection.items()):
+                continue
+            out = key[self.by.index(by)] if by else None
+            if by and pd.isna(out):
+                continue
+            if out not in result:
+                result[out] = Moments(self.columns, self.grids)
+            result[out].merge(group)
+        if by:
+            return result
+        return result.get(None, Moments(self.columns, self.grids))
@@ -0,0 +1,189 @@
+"""Per-stage profiling of dashboard reruns.
+
+Set DASHBOARD_PROFILE=1 to enable. Each app calls `begin(name)` once at the
+top of the script and `finish()` at the end; in between, `stage(...)` blocks
+and `@profiled` functions record wall time, CPU time (of the calling
+thread), rows processed and memory allocated. `finish()` shows the rerun's
+stages in a sidebar panel and appends them to the JSONL trace at
+DASHBOARD_PROFILE_TRACE (default profile_trace.jsonl), one line per stage.
+
+Allocation is measured with tracemalloc, which only runs while profiling is
+enabled and counts every thread of the process: a stage marked `overlapped`
+ran alongside another thread's stage (a chart worker, another session), and
+its allocation figures include that thread's. When disabled, `stage`
+returns a shared no-op context and `profiled` returns the function as is.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+
+ENABLED = os.environ.get("DASHBOARD_PROFILE", "").lower() not in ("", "0", "false", "no")
+TRACE_PATH = os.environ.get("DASHBOARD_PROFILE_TRACE", "profile_trace.jsonl")
+
+_local = threading.local()
+_MB = 1024 * 1024
+
+# Open stages of every thread: tracemalloc has one peak counter per process
+_open_lock = threading.Lock()
+_open_stages = set()
+
+
+class _NullStage:
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Stage:
+    def __init__(self, run, name, rows=None):
+        self.run = run
+        self.name = name
+        self.rows = rows
+        self.depth = len(run.open)
+        self._peak = 0
+        self._thread = threading.get_ident()
+        self.overlapped = False
+
+    def __enter__(self):
+        with _open_lock:
+            # Credit the peak so far to every open stage, on any thread, before resetting it
+            current, peak = tracemalloc.get_traced_memory()
+            for other in _open_stages:
+                other._peak = max(other._peak, peak)
+                if other._thread != self._thread:
+                    other.overlapped = self.overlapped = True
+            tracemalloc.reset_peak()
+            self._start_memory = current
+            self._peak = current
+            _open_stages.add(self)
+        self.run.open.append(self)
+        # Recorded in start order so nested stages follow their parent
+        self.record = {"stage": self.name, "depth": self.depth}
+        self.run.records.append(self.record)
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        wall = time.perf_counter() - self._start_wall
+        cpu = time.thread_time() - self._start_cpu
+        with _open_lock:
+            current, peak = tracemalloc.get_traced_memory()
+            self._peak = max(self._peak, peak)
+            _open_stages.discard(self)
+        self.run.open.pop()
+        self.record.update({
+            "wall_ms": round(wall * 1000, 3),
+            "cpu_ms": round(cpu * 1000, 3),
+            "rows": None if self.rows is None else int(self.rows),
+            "peak_alloc_mb": round((self._peak - self._start_memory) / _MB, 3),
+            "net_alloc_mb": round((current - self._start_memory) / _MB, 3),
+            "overlapped": self.overlapped,
+            "error": exc_type.__name__ if exc_type else None,
+        })
+        return False
+
+
+class Run:
+    """The stages recorded during one script run."""
+
+    def __init__(self, app):
+        self.app = app
+        self.id = uuid.uuid4().hex[:12]
+        self.started = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        self.records = []
+        self._threads = threading.local()
+
+    @property
+    def open(self):
+        # Stages nest per thread; a worker's stages start at the top level
+        stack = getattr(self._threads, "open", None)
+        if stack is None:
+            stack = self._threads.open = []
+        return stack
+
+
+def begin(app):
+    """Start recording a rerun of `app` on this thread (no-op when disabled)."""
+    if not ENABLED:
+        return None
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _local.run = Run(app)
+    return _local.run
+
+
+def current_run():
+    return getattr(_local, "run", None) if ENABLED else None
+
+
+def stage(name, rows=None, run=None):
+    """Context manager timing one stage; set `.rows` on it if not known upfront.
+
+    Pass `run` (from `current_run()`) to record from a worker thread.
+    """
+    run = run or current_run()
+    if run is None:
+        return _NULL_STAGE
+    return Stage(run, name, rows)
+
+
+def _count_rows(result):
+    shape = getattr(result, "shape", None)
+    return shape[0] if shape else None
+
+
+def profiled(name=None, rows=_count_rows):
+    """Decorator recording each call as a stage; `rows(result)` gives the row count."""
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(label) as s:
+                result = fn(*args, **kwargs)
+                s.rows = rows(result) if rows else None
+            return result
+        return wrapper
+    return decorate
+
+
+def finish(container=None):
+    """Show this rerun's stages in the sidebar and append them to the trace."""
+    run = current_run()
+    if run is None:
+        return None
+    _local.run = None
+    if not run.records:
+        return run
+
+    with open(TRACE_PATH, "a", encoding="utf-8") as f:
+        for record in run.records:
+            f.write(json.dumps({"app": run.app, "run": run.id, "time": run.started, **record}) + "\n")
+
+    import pandas as pd
+    import streamlit as st
+
+    table = pd.DataFrame(run.records)
+    table["stage"] = ["  " * depth + name for depth, name in zip(table["depth"], table["stage"])]
+    top = table[table["depth"] == 0]
+    panel = (container or st.sidebar).expander("⏱️ Profiling", expanded=False)
+    panel.caption(f"{top['wall_ms'].sum():,.1f} ms wall, {top['cpu_ms'].sum():,.1f} ms CPU "
+                  f"across {len(top)} stages · trace: {TRACE_PATH}")
+    panel.dataframe(table.drop(columns=["depth"]).set_index("stage"), width="stretch")
+    return run
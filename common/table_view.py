@@ -0,0 +1,97 @@
+"""Server-side paginated table for large frames.
+
+`st.dataframe(df)` serializes the whole frame to the browser. `paged_table`
+keeps the frame on the server and sends only the visible page, with sort
+and search driven by orderings that are computed once per column and
+cached across reruns.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+SEARCH_CACHE_SIZE = 8
+
+
+class TableIndex:
+    """Cached row orderings and search masks for one dataset.
+
+    The index holds positions only; callers pass the frame each time and
+    must use a new token whenever the data itself changes.
+    """
+
+    def __init__(self):
+        self._orders = {}
+        self._searches = OrderedDict()
+
+    def order(self, df, column, ascending=True):
+        """Row positions sorted by `column` (stable, missing values last)."""
+        key = (column, ascending)
+        if key not in self._orders:
+            values = df[column].reset_index(drop=True)
+            self._orders[key] = values.sort_values(
+                ascending=ascending, kind="stable", na_position="last"
+            ).index.to_numpy()
+        return self._orders[key]
+
+    def search(self, df, text):
+        """Boolean mask of rows where any text column contains `text`."""
+        text = text.strip().lower()
+        if text in self._searches:
+            self._searches.move_to_end(text)
+            return self._searches[text]
+        mask = np.zeros(len(df), dtype=bool)
+        for col in df.columns:
+            if pd.api.types.is_numeric_dtype(df[col]) or pd.api.types.is_datetime64_any_dtype(df[col]):
+                continue
+            mask |= df[col].astype("string").str.lower().str.contains(text, regex=False, na=False).to_numpy()
+        self._searches[text] = mask
+        if len(self._searches) > SEARCH_CACHE_SIZE:
+            self._searches.popitem(last=False)
+        return mask
+
+    def rows(self, df, mask=None, sort=None, ascending=True, search=""):
+        """Positions of the selected rows in display order."""
+        order = self.order(df, sort, ascending) if sort else np.arange(len(df))
+        keep = None if mask is None else np.asarray(mask, dtype=bool)
+        if search.strip():
+            found = self.search(df, search)
+            keep = found if keep is None else keep & found
+        if keep is not None:
+            order = order[keep[order]]
+        return order
+
+
+@st.cache_resource(max_entries=32)
+def _table_index(key, token, rows, columns):
+    return TableIndex()
+
+
+def paged_table(df, key, token, mask=None, page_size=50):
+    """Render one page of `df` (optionally restricted to rows where `mask`
+    is True) with search, sort and paging controls.
+
+    `token` identifies the data in `df` (a content hash, source and version,
+    the file it was read from): cached orderings are shared only between
+    frames with the same key, token and shape."""
+    index = _table_index(key, token, len(df), tuple(df.columns))
+
+    search_col, sort_col, order_col, page_col = st.columns([3, 2, 1, 1])
+    search = search_col.text_input("Search", key=f"{key}_search", placeholder="Filter rows by text")
+    sort = sort_col.selectbox("Sort by", [None] + list(df.columns), key=f"{key}_sort",
+                              format_func=lambda col: "(original order)" if col is None else col)
+    descending = order_col.checkbox("Descending", key=f"{key}_descending")
+
+    rows = index.rows(df, mask, sort, not descending, search)
+    pages = max(1, -(-len(rows) // page_size))
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = page_col.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+
+    start = (page - 1) * page_size
+    st.dataframe(df.iloc[rows[start:start + page_size]])
+    st.caption(f"Rows {min(start + 1, len(rows)):,}–{min(start + page_size, len(rows)):,} "
+               f"of {len(rows):,} · page {page} of {pages}")
@@ -0,0 +1,125 @@
+"""Background prewarming of the dashboards' caches.
+
+`start({name: warm, ...})` runs each `warm(step)` callable in a thread pool,
+once per server process. A warm function calls its project's cached loaders
+the way the dashboard's first run would, wrapping each in `with step(label):`
+so the time spent per loader is recorded. `current()` returns the running
+Warmup, whose `status()` reports each task's readiness and timings.
+
+Loaders are Streamlit caches shared by every session, so a visitor who
+arrives while a loader is still warming waits on the same computation rather
+than starting a second one.
+"""
+
+import importlib
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait as wait_all
+from contextlib import contextmanager
+
+_lock = threading.Lock()
+_warmup = None
+
+
+class Task:
+    """One project's warm-up: its state, steps and timings."""
+
+    def __init__(self, name, fn):
+        self.name = name
+        self.fn = fn
+        self.state = "pending"
+        self.started = None
+        self.finished = None
+        self.steps = []
+        self.error = None
+
+    @contextmanager
+    def step(self, label):
+        record = {"step": label, "seconds": None}
+        self.steps.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+
+    def run(self):
+        self.started = time.perf_counter()
+        self.state = "running"
+        try:
+            self.fn(self.step)
+            self.state = "ready"
+        except Exception as e:
+            self.state = "failed"
+            self.error = f"{type(e).__name__}: {e}"
+            traceback.print_exc()
+        finally:
+            self.finished = time.perf_counter()
+            print(f"warm-up: {self.name} {self.state} in {self.seconds:.2f} s", flush=True)
+
+    @property
+    def seconds(self):
+        if self.started is None:
+            return None
+        return (self.finished or time.perf_counter()) - self.started
+
+
+class Warmup:
+    def __init__(self, tasks, workers=None):
+        self.tasks = {name: Task(name, fn) for name, fn in tasks.items()}
+        self.started = time.perf_counter()
+        self._pool = ThreadPoolExecutor(max_workers=workers or len(self.tasks) or 1,
+                                        thread_name_prefix="warmup")
+        self._futures = {name: self._pool.submit(task.run) for name, task in self.tasks.items()}
+        self._pool.shutdown(wait=False)
+
+    def ready(self, name=None):
+        """Whether task `name` (or every task) has finished, successfully or not."""
+        names = [name] if name else self.tasks
+        return all(self._futures[n].done() for n in names)
+
+    def wait(self, name=None, timeout=None):
+        """Block until `name` (or every task) finishes or `timeout` passes; returns `ready(name)`."""
+        wait_all([self._futures[name]] if name else self._futures.values(), timeout=timeout)
+        return self.ready(name)
+
+    @property
+    def seconds(self):
+        """Wall time from start until the last task finished (so far, if still running)."""
+        ends = [task.finished for task in self.tasks.values()]
+        end = max(ends) if all(ends) else time.perf_counter()
+        return end - self.started
+
+    def status(self):
+        """One record per task: state, total seconds, per-step seconds and any error."""
+        return [{
+            "task": task.name,
+            "state": task.state,
+            "seconds": task.seconds,
+            "steps": {s["step"]: s["seconds"] for s in list(task.steps)},
+            "error": task.error,
+        } for task in self.tasks.values()]
+
+
+def start(tasks, workers=None):
+    """Start warming `tasks` unless this process already has; returns the Warmup."""
+    global _warmup
+    with _lock:
+        if _warmup is None:
+            _warmup = Warmup(tasks, workers)
+        return _warmup
+
+
+def current():
+    return _warmup
+
+
+def import_modules(step, *names):
+    """Import `names` as warm-up steps; missing optional libraries are skipped."""
+    for name in names:
+        with step(f"import {name}") as record:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                record["step"] += " (not installed)"
@@ -0,0 +1,97 @@
+"""All project dashboards as pages of one Streamlit app.
+
+    streamlit run dashboards.py
+
+Each page is the project's own script, which still runs on its own as well.
+On the first run after the server starts, every project's cached loaders are
+prewarmed in background threads (see common/warmup.py), so the first visitor
+of each dashboard finds its data parsed and its models fitted. The Warm-up
+page shows each project's readiness and how long each step took.
+
+The loaders live in each project's <name>_loaders module rather than in its
+page, so the warm-up and the page share the same caches. The project folders
+and the repo root are put on sys.path here; when a page runs on its own,
+Streamlit adds its folder, and its loaders module (imported before `common`)
+adds the repo root.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+import pandas as pd
+import streamlit as st
+
+ROOT = Path(__file__).resolve().parent
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+from common import warmup
+
+# (folder, script, title, icon, url path, loaders module)
+PROJECTS = [
+    ("Project_2_Student_Performance_Analysis", "app.py", "Student Performance", "📊", "students", "student_loaders"),
+    ("Project_4_COVID_Data_Analysis", "app.py", "COVID-19", "🌍", "covid", "covid_loaders"),
+    ("Project_5_E-Commerce Data Insights", "app.py", "E-Commerce", "🛍️", "ecommerce", "ecommerce_loaders"),
+    ("Project_6_Netflix_user_behaviour", "app.py", "Netflix Users", "📺", "netflix", "netflix_loaders"),
+    ("Project_7_Traffic_Pattern_Analysis", "app2.py", "Traffic", "🚦", "traffic", "traffic_loaders"),
+    ("Project_8_Survey_Visualization", "app.py", "Survey", "📋", "survey", "survey_loaders"),
+]
+
+# Each project's folder on the path, so its loaders module can be imported here
+for folder, *_ in PROJECTS:
+    if str(ROOT / folder) not in sys.path:
+        sys.path.append(str(ROOT / folder))
+
+
+def warm_project(module_name):
+    def warm(step):
+        with step("import loaders"):
+            module = importlib.import_module(module_name)
+        module.warm(step)
+    return warm
+
+
+# Started once per server process; later runs and sessions get the same Warmup
+warm = warmup.start({title: warm_project(module) for _, _, title, _, _, module in PROJECTS})
+
+
+def warmup_page():
+    st.title("⏱️ Cache Warm-up")
+    st.markdown("Loaders, derived tables and models prewarmed for each dashboard when the server started.")
+
+    # Refreshes itself every second until every project has finished
+    @st.fragment(run_every=None if warm.ready() else 1)
+    def status():
+        records = warm.status()
+        ready = sum(r["state"] == "ready" for r in records)
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Ready", f"{ready}/{len(records)}")
+        col2.metric("Failed", sum(r["state"] == "failed" for r in records))
+        col3.metric("Warm-up time", f"{warm.seconds:.1f} s")
+        st.dataframe(pd.DataFrame([{
+            "Dashboard": r["task"],
+            "State": r["state"],
+            "Seconds": None if r["seconds"] is None else round(r["seconds"], 2),
+            "Error": r["error"],
+        } for r in records]), hide_index=True, width="stretch")
+
+        st.subheader("Steps")
+        for r in records:
+            with st.expander(f"{r['task']} — {r['state']}"):
+                st.dataframe(pd.DataFrame({"Seconds": pd.Series(r["steps"], dtype=float).round(3)}),
+                             width="stretch")
+
+    status()
+
+
+pages = [st.Page(ROOT / folder / script, title=title, icon=icon, url_path=url_path)
+         for folder, script, title, icon, url_path, _ in PROJECTS]
+page = st.navigation({
+    "Dashboards": pages,
+    "Server": [st.Page(warmup_page, title="Warm-up", icon="⏱️", url_path="warmup")],
+})
+
+if not warm.ready():
+    done = sum(warm.ready(name) for name in warm.tasks)
+    st.sidebar.caption(f"⏳ Warming caches: {done}/{len(warm.tasks)} dashboards done")
+
+page.run()